@@ -0,0 +1,16 @@
+// CloudFront Function (viewer request) for the prerendered site.
+// Maps clean URLs onto the prerendered files in the private S3 origin:
+//   /gallery     -> /gallery/index.html
+//   /fa/         -> /fa/index.html
+// Requests for real files (anything with an extension) pass through.
+function handler(event) {
+  var request = event.request;
+  var uri = request.uri;
+
+  if (uri.endsWith('/')) {
+    request.uri = uri + 'index.html';
+  } else if (uri.lastIndexOf('.') <= uri.lastIndexOf('/')) {
+    request.uri = uri + '/index.html';
+  }
+  return request;
+}
@@ -0,0 +1,87 @@
+import path from 'node:path';
+import { gzipSync } from 'node:zlib';
+import type { Plugin, Rollup } from 'vite';
+
+type OutputBundle = Rollup.OutputBundle;
+type OutputChunk = Rollup.OutputChunk;
+
+interface ChunkGroup {
+  file: string;
+  files: string[];
+  bytes: number;
+  gzip: number;
+}
+
+export interface ChunkManifest {
+  entry: ChunkGroup;
+  routes: Record<string, ChunkGroup>;
+}
+
+function sizeOf(bundle: OutputBundle, fileName: string) {
+  const output = bundle[fileName];
+  const source = output.type === 'chunk' ? output.code : output.source;
+  const buffer =
+    typeof source === 'string'
+      ? Buffer.from(source)
+      : Buffer.from(source.buffer, source.byteOffset, source.byteLength);
+  return { bytes: buffer.byteLength, gzip: gzipSync(buffer).byteLength };
+}
+
+// Static import closure of a chunk, including the CSS Vite attaches to it.
+function closure(bundle: OutputBundle, chunk: OutputChunk, seen = new Set<string>()) {
+  if (seen.has(chunk.fileName)) return seen;
+  seen.add(chunk.fileName);
+  chunk.viteMetadata?.importedCss.forEach((css) => seen.add(css));
+  for (const imported of chunk.imports) {
+    const next = bundle[imported];
+    if (next?.type === 'chunk') closure(bundle, next, seen);
+  }
+  return seen;
+}
+
+function group(bundle: OutputBundle, chunk: OutputChunk, files: string[]): ChunkGroup {
+  let bytes = 0;
+  let gzip = 0;
+  for (const file of files) {
+    const size = sizeOf(bundle, file);
+    bytes += size.bytes;
+    gzip += size.gzip;
+  }
+  return { file: chunk.fileName, files, bytes, gzip };
+}
+
+/**
+ * Emits `chunk-manifest.json` next to the build output, listing the files each
+ * lazily loaded page pulls in on top of the entry chunk and their raw/gzip
+ * sizes, so per-route bundle cost can be checked after every build.
+ */
+export default function chunkManifest(fileName = 'chunk-manifest.json'): Plugin {
+  return {
+    name: 'msmaaedeh:chunk-manifest',
+    apply: (config, { command }) => command === 'build' && !config.build?.ssr,
+    generateBundle(_options, bundle) {
+      const chunks = Object.values(bundle).filter((o): o is OutputChunk => o.type === 'chunk');
+      const entry = chunks.find((c) => c.isEntry);
+      if (!entry) return;
+
+      const entryFiles = closure(bundle, entry);
+      const manifest: ChunkManifest = {
+        entry: group(bundle, entry, [...entryFiles]),
+        routes: {},
+      };
+
+      for (const chunk of chunks) {
+        const id = chunk.facadeModuleId;
+        if (!chunk.isDynamicEntry || !id || !id.includes('/src/pages/')) continue;
+        const files = [...closure(bundle, chunk)].filter((f) => !entryFiles.has(f));
+        manifest.routes[path.basename(id, path.extname(id))] = group(bundle, chunk, files);
+      }
+
+      this.emitFile({
+        type: 'asset',
+        fileName,
+        source: `${JSON.stringify(manifest, null, 2)}\n`,
+      });
+    },
+  };
+}
@@ -0,0 +1,56 @@
+import fs from 'node:fs';
+import path from 'node:path';
+import type { Plugin } from 'vite';
+
+interface LocaleParityOptions {
+  dir?: string;
+  base?: string;
+}
+
+function flattenKeys(value: unknown, prefix = ''): string[] {
+  if (value === null || typeof value !== 'object') return [prefix];
+  return Object.entries(value).flatMap(([key, child]) =>
+    flattenKeys(child, prefix ? `${prefix}.${key}` : key),
+  );
+}
+
+function readNamespaces(dir: string) {
+  const namespaces = new Map<string, Set<string>>();
+  for (const file of fs.readdirSync(dir).filter((f) => f.endsWith('.json'))) {
+    const data: unknown = JSON.parse(fs.readFileSync(path.join(dir, file), 'utf8'));
+    namespaces.set(path.basename(file, '.json'), new Set(flattenKeys(data)));
+  }
+  return namespaces;
+}
+
+/** Lists `<lng>/<ns>:<key>` entries present in the base language but missing elsewhere. */
+export function findMissingKeys({ dir = 'src/locales', base = 'en' }: LocaleParityOptions = {}) {
+  const languages = fs.readdirSync(dir).filter((d) => fs.statSync(path.join(dir, d)).isDirectory());
+  const reference = readNamespaces(path.join(dir, base));
+  const missing: string[] = [];
+
+  for (const lng of languages.filter((l) => l !== base)) {
+    const target = readNamespaces(path.join(dir, lng));
+    for (const [ns, keys] of reference) {
+      const translated = target.get(ns) ?? new Set<string>();
+      for (const key of keys) {
+        if (!translated.has(key)) missing.push(`${lng}/${ns}:${key}`);
+      }
+    }
+  }
+  return missing;
+}
+
+/** Fails the production build when a translation key from `en` is missing in another language. */
+export default function localeParity(options: LocaleParityOptions = {}): Plugin {
+  return {
+    name: 'msmaaedeh:locale-parity',
+    apply: 'build',
+    buildStart() {
+      const missing = findMissingKeys(options);
+      if (missing.length > 0) {
+        this.error(`Missing translations (${missing.length}):\n  ${missing.join('\n  ')}`);
+      }
+    },
+  };
+}
@@ -0,0 +1,292 @@
+import { createHash } from 'node:crypto';
+import fs from 'node:fs/promises';
+import os from 'node:os';
+import path from 'node:path';
+import type Sharp from 'sharp';
+import type { Plugin, ResolvedConfig, Rollup } from 'vite';
+
+type Format = 'avif' | 'webp';
+
+interface ResponsiveImagesOptions {
+  /** Folder holding the original photos; each sub-folder becomes one manifest module. */
+  sourceDir?: string;
+  /** Where processed variants are kept between builds. */
+  cacheDir?: string;
+  widths?: number[];
+  formats?: Format[];
+  /**
+   * JSON data folders mapped to the image folder their items' `image` names
+   * refer to. Each name is replaced with that photo's ResponsiveImageData, so
+   * a data shard brings the image data of its own items and nothing more.
+   */
+  dataDirs?: Record<string, string>;
+}
+
+interface ProcessedFile {
+  name: string;
+  width: number;
+  format: Format;
+}
+
+interface CacheEntry {
+  width: number;
+  height: number;
+  placeholder: string;
+  files: ProcessedFile[];
+}
+
+/** Shape of each manifest entry, and of an `image` embedded in a data shard. */
+export interface ResponsiveImageData {
+  src: string;
+  width: number;
+  height: number;
+  placeholder: string;
+  sources: { type: `image/${Format}`; srcSet: string }[];
+}
+
+const VIRTUAL_PREFIX = 'virtual:responsive-images/';
+const RESOLVED_PREFIX = `\0${VIRTUAL_PREFIX}`;
+const DEV_URL_PREFIX = '/@responsive-images/';
+const SOURCE_EXTENSIONS = new Set(['.jpg', '.jpeg', '.png', '.webp', '.avif', '.tif', '.tiff']);
+const MIME: Record<string, string> = { '.avif': 'image/avif', '.webp': 'image/webp' };
+
+// sharp is a native module and only needed once there are photos to process,
+// so it is loaded on first use rather than whenever the Vite config is read.
+let sharpModule: Promise<typeof Sharp> | undefined;
+
+function loadSharp() {
+  sharpModule ??= import('sharp').then((mod) => mod.default);
+  return sharpModule;
+}
+
+async function walk(dir: string): Promise<string[]> {
+  const entries = await fs.readdir(dir, { withFileTypes: true }).catch(() => []);
+  const nested = await Promise.all(
+    entries.map((entry) => {
+      const full = path.join(dir, entry.name);
+      if (entry.isDirectory()) return walk(full);
+      return SOURCE_EXTENSIONS.has(path.extname(entry.name).toLowerCase()) ? [full] : [];
+    }),
+  );
+  return nested.flat();
+}
+
+// Manifest key: path inside the folder, without extension.
+function keyFor(folder: string, file: string) {
+  return path.relative(folder, file).replace(/\.[^.]+$/, '').split(path.sep).join('/');
+}
+
+async function mapLimit<T, R>(items: T[], limit: number, fn: (item: T) => Promise<R>) {
+  const results: R[] = new Array(items.length);
+  let next = 0;
+  const workers = Array.from({ length: Math.min(limit, items.length) }, async () => {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await fn(items[index]);
+    }
+  });
+  await Promise.all(workers);
+  return results;
+}
+
+/**
+ * Turns photos under `src/assets/images/<folder>/` into AVIF/WebP variants at
+ * several widths and an inline LQIP placeholder, and
+ * exposes them as `virtual:responsive-images/<folder>` manifests keyed by the
+ * file name without extension, or inline in the JSON shards of `dataDirs`.
+ * Variants are content-hashed and cached under `node_modules/.cache`, so only
+ * new or edited photos are re-encoded.
+ */
+export default function responsiveImages(options: ResponsiveImagesOptions = {}): Plugin {
+  const {
+    sourceDir = 'src/assets/images',
+    cacheDir = 'node_modules/.cache/responsive-images',
+    widths = [400, 800, 1200, 1600],
+    formats = ['avif', 'webp'],
+    dataDirs = { 'src/data/gallery': 'gallery' },
+  } = options;
+  const settings = JSON.stringify({ widths, formats });
+
+  let config: ResolvedConfig;
+  let root: string;
+  let cacheRoot: string;
+  let dataFolders: Map<string, string>;
+  const emitted = new Set<string>();
+  const processing = new Map<string, Promise<CacheEntry & { hash: string }>>();
+
+  async function encode(file: string, hash: string, outDir: string): Promise<CacheEntry> {
+    const sharp = await loadSharp();
+    const source = await fs.readFile(file);
+    const base = path.basename(file, path.extname(file)).toLowerCase().replace(/[^a-z0-9-]+/g, '-');
+    const image = () => sharp(source).rotate();
+
+    const meta = await sharp(source).metadata();
+    const rotated = (meta.orientation ?? 1) >= 5;
+    const width = (rotated ? meta.height : meta.width) ?? 0;
+    const height = (rotated ? meta.width : meta.height) ?? 0;
+
+    // Never upscale: photos narrower than the largest breakpoint get their own width instead.
+    const targetWidths = widths.filter((w) => w < width);
+    if (targetWidths.length < widths.length) targetWidths.push(width);
+
+    const files: ProcessedFile[] = [];
+    for (const target of targetWidths) {
+      for (const format of formats) {
+        const name = `${base}-${target}.${hash}.${format}`;
+        const pipeline = image().resize(target);
+        const output = format === 'avif' ? pipeline.avif({ quality: 50 }) : pipeline.webp({ quality: 80 });
+        await output.toFile(path.join(outDir, name));
+        files.push({ name, width: target, format });
+      }
+    }
+
+    const lqip = await image().resize(16).webp({ quality: 40 }).toBuffer();
+
+    return {
+      width,
+      height,
+      placeholder: `data:image/webp;base64,${lqip.toString('base64')}`,
+      files,
+    };
+  }
+
+  function processImage(file: string) {
+    let pending = processing.get(file);
+    if (!pending) {
+      pending = (async () => {
+        const hash = createHash('sha256')
+          .update(settings)
+          .update(await fs.readFile(file))
+          .digest('hex')
+          .slice(0, 10);
+        const outDir = path.join(cacheRoot, hash);
+        const metaFile = path.join(outDir, 'meta.json');
+        try {
+          return { hash, ...(JSON.parse(await fs.readFile(metaFile, 'utf8')) as CacheEntry) };
+        } catch {
+          await fs.mkdir(outDir, { recursive: true });
+          const entry = await encode(file, hash, outDir);
+          await fs.writeFile(metaFile, JSON.stringify(entry));
+          return { hash, ...entry };
+        }
+      })();
+      processing.set(file, pending);
+    }
+    return pending;
+  }
+
+  /** Emits the variants of one photo (client build only) and describes them. */
+  async function imageData(context: Rollup.PluginContext, file: string): Promise<ResponsiveImageData> {
+    const entry = await processImage(file);
+    const isBuild = config.command === 'build';
+    const urlFor = (name: string) => {
+      if (!isBuild) return `${DEV_URL_PREFIX}${entry.hash}/${name}`;
+      return `${config.base}${path.posix.join(config.build.assetsDir, 'images', name)}`;
+    };
+    // The SSR bundle only needs the URLs; the client build emits the files.
+    if (isBuild && !config.build.ssr) {
+      for (const { name } of entry.files) {
+        const fileName = path.posix.join(config.build.assetsDir, 'images', name);
+        if (emitted.has(fileName)) continue;
+        emitted.add(fileName);
+        context.emitFile({ type: 'asset', fileName, source: await fs.readFile(path.join(cacheRoot, entry.hash, name)) });
+      }
+    }
+
+    const largest = Math.max(...entry.files.map((f) => f.width));
+    const fallback = entry.files.find((f) => f.format === 'webp' && f.width === largest) ?? entry.files[0];
+    return {
+      src: urlFor(fallback.name),
+      width: entry.width,
+      height: entry.height,
+      placeholder: entry.placeholder,
+      sources: formats.map((format) => ({
+        type: `image/${format}` as const,
+        srcSet: entry.files
+          .filter((f) => f.format === format)
+          .map((f) => `${urlFor(f.name)} ${f.width}w`)
+          .join(', '),
+      })),
+    };
+  }
+
+  return {
+    name: 'msmaaedeh:responsive-images',
+    enforce: 'pre',
+    configResolved(resolved) {
+      config = resolved;
+      root = path.resolve(config.root, sourceDir);
+      cacheRoot = path.resolve(config.root, cacheDir);
+      dataFolders = new Map(Object.entries(dataDirs).map(([dir, folder]) => [path.resolve(config.root, dir), folder]));
+    },
+    resolveId(id) {
+      if (id.startsWith(VIRTUAL_PREFIX)) return `\0${id}`;
+    },
+    buildStart() {
+      emitted.clear();
+    },
+    async load(id) {
+      if (!id.startsWith(RESOLVED_PREFIX)) return;
+      const folder = path.join(root, id.slice(RESOLVED_PREFIX.length));
+      const files = (await walk(folder)).sort();
+      files.forEach((file) => this.addWatchFile(file));
+
+      const entries = await mapLimit(files, os.availableParallelism(), (file) => imageData(this, file));
+      const manifest = Object.fromEntries(files.map((file, index) => [keyFor(folder, file), entries[index]]));
+      return `export default ${JSON.stringify(manifest)};`;
+    },
+    // Runs before vite:json (enforce: 'pre'), so it sees the raw JSON array.
+    async transform(code, id) {
+      if (id.includes('?') || !id.endsWith('.json')) return;
+      const imageFolder = dataFolders.get(path.resolve(path.dirname(id)));
+      if (!imageFolder) return;
+
+      const folder = path.join(root, imageFolder);
+      const photos = new Map((await walk(folder)).map((photo) => [keyFor(folder, photo), photo]));
+      const items = JSON.parse(code) as { image?: string | ResponsiveImageData }[];
+      await mapLimit(items, os.availableParallelism(), async (item) => {
+        if (typeof item.image !== 'string') return;
+        const photo = photos.get(item.image);
+        if (!photo) {
+          this.warn(`${path.relative(config.root, id)}: no photo "${item.image}" in ${sourceDir}/${imageFolder}/`);
+          delete item.image;
+          return;
+        }
+        this.addWatchFile(photo);
+        item.image = await imageData(this, photo);
+      });
+      return { code: JSON.stringify(items), map: null };
+    },
+    configureServer(server) {
+      server.middlewares.use(DEV_URL_PREFIX, (req, res, next) => {
+        const file = path.join(cacheRoot, path.normalize(decodeURIComponent(req.url ?? '')));
+        if (!file.startsWith(cacheRoot)) return next();
+        fs.readFile(file).then((data) => {
+          res.setHeader('Content-Type', MIME[path.extname(file)] ?? 'application/octet-stream');
+          res.setHeader('Cache-Control', 'max-age=31536000,immutable');
+          res.end(data);
+        }, () => next());
+      });
+
+      // New, edited or removed photos re-generate the manifest of their folder
+      // and the data shards that point into it.
+      const refresh = (file: string) => {
+        if (!file.startsWith(root)) return;
+        processing.delete(file);
+        const folder = path.relative(root, file).split(path.sep)[0];
+        const stale = [...server.moduleGraph.idToModuleMap.values()].filter(
+          (mod) =>
+            mod.id === `${RESOLVED_PREFIX}${folder}` ||
+            (mod.file?.endsWith('.json') && dataFolders.get(path.dirname(mod.file)) === folder),
+        );
+        if (stale.length === 0) return;
+        stale.forEach((mod) => server.moduleGraph.invalidateModule(mod));
+        server.ws.send({ type: 'full-reload' });
+      };
+      server.watcher.add(root);
+      server.watcher.on('add', refresh);
+      server.watcher.on('change', refresh);
+      server.watcher.on('unlink', refresh);
+    },
+  };
+}
@@ -0,0 +1,377 @@
+// Performance benchmark and bundle budgets (`npm run bench`):
+//
+//   1. builds and prerenders the site (`npm run build:ssg`; skip with --skip-build)
+//   2. gzip/brotli size of the entry, each page, each chunk and the CSS
+//   3. throttled cold loads of every route in both languages against `vite preview`
+//   4. time to switch Gallery categories with a synthetic 2,000-item dataset
+//
+// Steps 3 and 4 drive headless Chromium through Playwright, which is optional:
+//   npm i -D playwright && npx playwright install chromium
+//
+// Everything is checked against bench/budgets.json, written to
+// bench/results/latest.json and compared with bench/results/baseline.json (the
+// last passing run). A blown budget or a regression exits non-zero; pass
+// --accept to make this run the new baseline anyway.
+import { spawnSync } from 'node:child_process';
+import { mkdir, readdir, readFile, writeFile } from 'node:fs/promises';
+import path from 'node:path';
+import { fileURLToPath, pathToFileURL } from 'node:url';
+import { brotliCompressSync, gzipSync } from 'node:zlib';
+
+const root = fileURLToPath(new URL('..', import.meta.url));
+const dist = path.join(root, 'dist');
+const resultsDir = path.join(root, 'bench', 'results');
+const args = new Set(process.argv.slice(2));
+
+const RUNS = Number(process.env.BENCH_RUNS ?? 3);
+const PORT = Number(process.env.BENCH_PORT ?? 4179);
+const GALLERY_ITEMS = 2000;
+// Posts per all-<n>.json page, as in src/data/gallery.ts.
+const ALL_PAGE_SIZE = 24;
+
+// Roughly Lighthouse's mobile profile: slow 4G and a 4x slower CPU.
+const THROTTLING = {
+  network: { offline: false, latency: 150, downloadThroughput: (1638.4 * 1024) / 8, uploadThroughput: (750 * 1024) / 8 },
+  cpuSlowdown: 4,
+  viewport: { width: 412, height: 823 },
+};
+
+const budgets = JSON.parse(await readFile(path.join(root, 'bench', 'budgets.json'), 'utf8'));
+const failures = [];
+
+const kb = (n) => `${(n / 1024).toFixed(1)} kB`;
+const median = (values) => [...values].sort((a, b) => a - b)[Math.floor(values.length / 2)];
+const round = (n, digits = 0) => Number(n.toFixed(digits));
+
+if (!args.has('--skip-build')) {
+  const build = spawnSync('npm', ['run', 'build:ssg'], { cwd: root, stdio: 'inherit', shell: process.platform === 'win32' });
+  if (build.status !== 0) process.exit(build.status ?? 1);
+}
+
+// --- bundle sizes ----------------------------------------------------------
+
+async function compressedSize(file) {
+  const source = await readFile(path.join(dist, file));
+  return { bytes: source.byteLength, gzip: gzipSync(source).byteLength, brotli: brotliCompressSync(source).byteLength };
+}
+
+const sum = (sizes) =>
+  sizes.reduce((t, s) => ({ bytes: t.bytes + s.bytes, gzip: t.gzip + s.gzip, brotli: t.brotli + s.brotli }), {
+    bytes: 0,
+    gzip: 0,
+    brotli: 0,
+  });
+
+// Content hashes change on every edit, so chunks are compared by name.
+const stableName = (file) => path.basename(file).replace(/-[\w-]{8}(?=\.\w+$)/, '');
+
+async function measureBytes() {
+  const chunkManifest = JSON.parse(await readFile(path.join(dist, 'chunk-manifest.json'), 'utf8'));
+  const assets = (await readdir(path.join(dist, 'assets'))).filter((f) => /\.(js|css)$/.test(f)).map((f) => `assets/${f}`);
+  const sizes = Object.fromEntries(await Promise.all(assets.map(async (f) => [f, await compressedSize(f)])));
+  const group = (files) => sum(files.map((f) => sizes[f]).filter(Boolean));
+
+  const chunks = {};
+  for (const file of assets.filter((f) => f.endsWith('.js'))) {
+    const name = stableName(file);
+    chunks[name] = chunks[name] ? sum([chunks[name], sizes[file]]) : sizes[file];
+  }
+
+  return {
+    entry: group(chunkManifest.entry.files),
+    routes: Object.fromEntries(Object.entries(chunkManifest.routes).map(([name, g]) => [name, group(g.files)])),
+    chunks,
+    css: group(assets.filter((f) => f.endsWith('.css'))),
+  };
+}
+
+function checkSize(label, size, budget) {
+  for (const key of ['gzip', 'brotli']) {
+    if (size[key] > budget[key]) failures.push(`${label}: ${key} ${kb(size[key])} is over the ${kb(budget[key])} budget`);
+  }
+}
+
+const bytes = await measureBytes();
+checkSize('entry', bytes.entry, budgets.bytes.entry);
+checkSize('css', bytes.css, budgets.bytes.css);
+for (const [name, size] of Object.entries(bytes.routes)) checkSize(`route ${name}`, size, budgets.bytes.route);
+for (const [name, size] of Object.entries(bytes.chunks)) checkSize(`chunk ${name}`, size, budgets.bytes.chunk);
+
+console.log('\nbundle sizes (gzip / brotli)');
+console.log(`  entry  ${kb(bytes.entry.gzip)} / ${kb(bytes.entry.brotli)}`);
+console.log(`  css    ${kb(bytes.css.gzip)} / ${kb(bytes.css.brotli)}`);
+for (const [name, size] of Object.entries(bytes.routes)) console.log(`  ${name.padEnd(10)} +${kb(size.gzip)} / +${kb(size.brotli)}`);
+
+function gitCommit() {
+  const git = spawnSync('git', ['rev-parse', '--short', 'HEAD'], { cwd: root, encoding: 'utf8' });
+  return git.status === 0 ? git.stdout.trim() : undefined;
+}
+
+const results = { date: new Date().toISOString(), commit: gitCommit(), bytes };
+
+// --- browser runs ----------------------------------------------------------
+
+// Runs in the page before any app code.
+function observeVitals() {
+  const vitals = { fcp: 0, lcp: 0, cls: 0, tbt: 0 };
+  window.__benchVitals = vitals;
+  const observe = (type, onEntry) =>
+    new PerformanceObserver((list) => list.getEntries().forEach(onEntry)).observe({ type, buffered: true });
+  observe('paint', (e) => {
+    if (e.name === 'first-contentful-paint') vitals.fcp = e.startTime;
+  });
+  observe('largest-contentful-paint', (e) => {
+    vitals.lcp = e.startTime;
+  });
+  observe('layout-shift', (e) => {
+    if (!e.hadRecentInput) vitals.cls += e.value;
+  });
+  observe('longtask', (e) => {
+    vitals.tbt += Math.max(0, e.duration - 50);
+  });
+}
+
+async function newThrottledPage(browser) {
+  const context = await browser.newContext({ serviceWorkers: 'block', viewport: THROTTLING.viewport });
+  const page = await context.newPage();
+  const cdp = await context.newCDPSession(page);
+  await cdp.send('Network.enable');
+  await cdp.send('Network.emulateNetworkConditions', THROTTLING.network);
+  await cdp.send('Emulation.setCPUThrottlingRate', { rate: THROTTLING.cpuSlowdown });
+  return { context, page };
+}
+
+async function loadPage(browser, url) {
+  const { context, page } = await newThrottledPage(browser);
+  await page.addInitScript(observeVitals);
+  await page.goto(url, { waitUntil: 'load' });
+  // let LCP candidates and late layout shifts settle
+  await page.waitForTimeout(1000);
+  const metrics = await page.evaluate(() => {
+    const [navigation] = performance.getEntriesByType('navigation');
+    const resources = performance.getEntriesByType('resource');
+    return {
+      ...window.__benchVitals,
+      ttfb: navigation.responseStart,
+      load: navigation.loadEventEnd,
+      transfer: navigation.transferSize + resources.reduce((total, r) => total + r.transferSize, 0),
+      requests: resources.length + 1,
+    };
+  });
+  await context.close();
+  return metrics;
+}
+
+function syntheticGallery(tags) {
+  return Array.from({ length: GALLERY_ITEMS }, (_, i) => ({
+    id: `bench-${i}`,
+    tags: i % 5 === 0 ? [tags[i % tags.length], tags[(i + 3) % tags.length]] : [tags[i % tags.length]],
+    title: `Synthetic post ${i + 1}`,
+    emoji: '🍣',
+  }));
+}
+
+/**
+ * Swaps the gallery shards for the synthetic set and returns how many items
+ * each filter holds, or undefined if this build has no shards to intercept.
+ * "All" can only get as many all-<n> pages as the build has (the page count is
+ * fixed at build time), so it holds fewer than GALLERY_ITEMS unless the real
+ * gallery is that large.
+ */
+async function useSyntheticGallery(context, origin) {
+  const viteManifest = JSON.parse(await readFile(path.join(dist, '.vite', 'manifest.json'), 'utf8'));
+  const shards = Object.entries(viteManifest).flatMap(([key, chunk]) => {
+    const match = /^src\/data\/gallery\/([\w-]+)\.json$/.exec(key);
+    return match ? [[match[1], chunk.file]] : [];
+  });
+  if (shards.length === 0) return undefined;
+
+  const categoryForTag = JSON.parse(await readFile(path.join(root, 'src', 'data', 'hashtag-categories.json'), 'utf8'));
+  const items = syntheticGallery(Object.keys(categoryForTag));
+  const sizes = {};
+  for (const [name, file] of shards) {
+    const page = /^all-(\d+)$/.exec(name);
+    const shard = page
+      ? items.slice(Number(page[1]) * ALL_PAGE_SIZE, (Number(page[1]) + 1) * ALL_PAGE_SIZE)
+      : items.filter((item) => item.tags.some((tag) => categoryForTag[tag] === name));
+    const filter = page ? 'all' : name;
+    sizes[filter] = (sizes[filter] ?? 0) + shard.length;
+    const body = `export default ${JSON.stringify(shard)}`;
+    await context.route(`${origin}/${file}`, (route) => route.fulfill({ contentType: 'text/javascript', body }));
+  }
+  return sizes;
+}
+
+async function benchCategorySwitch(browser, origin, lng) {
+  const { context, page } = await newThrottledPage(browser);
+  const sizes = await useSyntheticGallery(context, origin);
+  if (!sizes) {
+    await context.close();
+    return undefined;
+  }
+
+  // Arrive client-side, so the prerendered (real) gallery markup is not hydrated with synthetic data.
+  const base = lng === 'en' ? '' : `/${lng}`;
+  await page.goto(`${origin}${base}/`, { waitUntil: 'load' });
+  // the desktop links are hidden at this viewport, so click through the DOM
+  await page.$eval(`nav a[href="${base}/gallery"]`, (link) => link.click());
+  await page.waitForSelector('[data-category]');
+  const categories = await page.$$eval('[data-category]', (buttons) => buttons.map((b) => b.dataset.category));
+
+  const samples = Object.fromEntries(categories.map((c) => [c, []]));
+  for (let run = 0; run < RUNS; run++) {
+    // start from the last button so every click, including the first, switches category
+    for (const category of [...categories.slice(1), categories[0]]) {
+      const elapsed = await page.evaluate(async (category) => {
+        const button = document.querySelector(`[data-category="${category}"]`);
+        const selected = `[data-category="${category}"][aria-pressed="true"]`;
+        const start = performance.now();
+        button.click();
+        // The switch renders in a transition, so the click returns before the
+        // new grid commits: wait for the pressed button, then for its paint.
+        await new Promise((resolve) => {
+          if (document.querySelector(selected)) return resolve();
+          const observer = new MutationObserver(() => {
+            if (!document.querySelector(selected)) return;
+            observer.disconnect();
+            resolve();
+          });
+          observer.observe(document.body, { subtree: true, attributes: true, attributeFilter: ['aria-pressed'] });
+        });
+        await new Promise((resolve) => requestAnimationFrame(() => setTimeout(resolve, 0)));
+        return performance.now() - start;
+      }, category);
+      samples[category].push(elapsed);
+    }
+  }
+  await context.close();
+  const timings = Object.fromEntries(Object.entries(samples).map(([c, values]) => [c, round(median(values), 1)]));
+  return { timings, sizes };
+}
+
+async function runBrowserBenchmarks() {
+  const playwright = await import('playwright').catch(() => null);
+  if (!playwright) {
+    console.log('\nplaywright is not installed; skipping page loads and the gallery benchmark');
+    console.log('  npm i -D playwright && npx playwright install chromium');
+    return;
+  }
+
+  const { pages, languages } = await import(pathToFileURL(path.join(root, 'dist-ssr', 'entry-server.js')).href);
+  const { preview } = await import('vite');
+  const server = await preview({ root, logLevel: 'warn', preview: { port: PORT, strictPort: true, open: false } });
+  const origin = `http://localhost:${PORT}`;
+  const browser = await playwright.chromium.launch();
+
+  try {
+    results.pages = {};
+    console.log(`\npage loads (median of ${RUNS}, ${THROTTLING.cpuSlowdown}x CPU, slow 4G)`);
+    for (const lng of languages) {
+      for (const { path: routePath } of pages) {
+        const url = lng === 'en' ? routePath : `/${lng}${routePath}`;
+        const runs = [];
+        for (let i = 0; i < RUNS; i++) runs.push(await loadPage(browser, `${origin}${url}`));
+        const metrics = Object.fromEntries(
+          Object.keys(runs[0]).map((key) => [key, round(median(runs.map((r) => r[key])), key === 'cls' ? 4 : 0)]),
+        );
+        results.pages[url] = metrics;
+        console.log(
+          `  ${url.padEnd(14)} ttfb ${metrics.ttfb}  fcp ${metrics.fcp}  lcp ${metrics.lcp}  cls ${metrics.cls}  tbt ${metrics.tbt}  ${kb(metrics.transfer)}`,
+        );
+        if (metrics.lcp > budgets.timings.lcp) failures.push(`${url}: LCP ${metrics.lcp} ms is over ${budgets.timings.lcp} ms`);
+        if (metrics.cls > budgets.timings.cls) failures.push(`${url}: CLS ${metrics.cls} is over ${budgets.timings.cls}`);
+        if (metrics.tbt > budgets.timings.tbt) failures.push(`${url}: TBT ${metrics.tbt} ms is over ${budgets.timings.tbt} ms`);
+      }
+    }
+
+    results.categorySwitch = {};
+    console.log(`\ngallery category switch, ${GALLERY_ITEMS} synthetic items (ms to next paint)`);
+    for (const lng of languages) {
+      const switched = await benchCategorySwitch(browser, origin, lng);
+      if (!switched) {
+        console.log('  no gallery shards found in the build; skipped');
+        break;
+      }
+      const { timings, sizes } = switched;
+      if (!results.gallerySizes) {
+        results.gallerySizes = sizes;
+        console.log(`  items per filter: ${Object.entries(sizes).map(([c, n]) => `${c} ${n}`).join('  ')}`);
+        if (sizes.all < GALLERY_ITEMS) {
+          console.log(`  "all" holds only the build's ${sizes.all / ALL_PAGE_SIZE} page(s) of ${ALL_PAGE_SIZE}`);
+        }
+      }
+      results.categorySwitch[lng] = timings;
+      console.log(`  ${lng}  ${Object.entries(timings).map(([c, ms]) => `${c} ${ms}`).join('  ')}`);
+      for (const [category, ms] of Object.entries(timings)) {
+        if (ms > budgets.timings.categorySwitch) {
+          failures.push(`${lng} gallery "${category}": ${ms} ms is over ${budgets.timings.categorySwitch} ms`);
+        }
+      }
+    }
+  } finally {
+    await browser.close();
+    await server.close();
+  }
+}
+
+await runBrowserBenchmarks();
+
+// --- comparison with the previous run --------------------------------------
+
+// What a leaf measures decides how much it may grow: bytes, a layout-shift score, or a duration.
+function kindOf([section, ...rest]) {
+  const leaf = rest[rest.length - 1];
+  if (section === 'bytes') return leaf === 'gzip' || leaf === 'brotli' ? 'bytes' : undefined;
+  if (section === 'pages') {
+    if (leaf === 'cls') return 'cls';
+    if (leaf === 'transfer') return 'bytes';
+    return leaf === 'requests' ? undefined : 'timing';
+  }
+  return section === 'categorySwitch' ? 'timing' : undefined;
+}
+
+function findRegressions(current, baseline, keyPath = [], found = []) {
+  for (const [key, value] of Object.entries(current)) {
+    const previous = baseline?.[key];
+    if (previous === undefined) continue;
+    const here = [...keyPath, key];
+    if (typeof value === 'object' && value !== null) {
+      findRegressions(value, previous, here, found);
+      continue;
+    }
+    const kind = typeof value === 'number' ? kindOf(here) : undefined;
+    if (!kind) continue;
+
+    const { regression: r } = budgets;
+    const allowed =
+      kind === 'bytes'
+        ? Math.max(r.bytesMin, (previous * r.bytesPercent) / 100)
+        : kind === 'cls'
+          ? r.clsMin
+          : Math.max(r.timingMinMs, (previous * r.timingPercent) / 100);
+    if (value - previous > allowed) found.push(`${here.join(' › ')}: ${previous} → ${value}`);
+  }
+  return found;
+}
+
+await mkdir(resultsDir, { recursive: true });
+await writeFile(path.join(resultsDir, 'latest.json'), `${JSON.stringify(results, null, 2)}\n`);
+
+const baselineFile = path.join(resultsDir, 'baseline.json');
+const baseline = await readFile(baselineFile, 'utf8').then(JSON.parse, () => undefined);
+const regressions = baseline ? findRegressions(results, baseline) : [];
+if (baseline) console.log(`\ncompared with ${baseline.commit ?? 'baseline'} from ${baseline.date}`);
+
+for (const message of failures) console.error(`  budget      ${message}`);
+for (const message of regressions) console.error(`  regression  ${message}`);
+
+if ((failures.length === 0 && regressions.length === 0) || args.has('--accept')) {
+  // sections this run skipped (no playwright) keep their previous baseline
+  await writeFile(baselineFile, `${JSON.stringify({ ...baseline, ...results }, null, 2)}\n`);
+  console.log('\nbaseline updated: bench/results/baseline.json');
+}
+
+if (failures.length > 0 || regressions.length > 0) {
+  console.error(`\n${failures.length} budget failure(s), ${regressions.length} regression(s)`);
+  if (!args.has('--accept')) process.exit(1);
+}
@@ -0,0 +1,27 @@
+#!/usr/bin/env sh
+# Uploads a `npm run build:ssg` output to S3 and invalidates CloudFront.
+#
+#   S3_BUCKET=my-bucket CLOUDFRONT_DISTRIBUTION_ID=E123 npm run deploy:s3
+#
+# Hashed files under assets/ are immutable and cached for a year. They are
+# uploaded first and never deleted here, so tabs still running the previous
+# deploy can keep lazy-loading their chunks. HTML and other unhashed files
+# are revalidated on every request.
+set -eu
+
+: "${S3_BUCKET:?S3_BUCKET is required}"
+
+aws s3 sync dist/assets "s3://$S3_BUCKET/assets" \
+  --cache-control "public,max-age=31536000,immutable"
+
+aws s3 sync dist "s3://$S3_BUCKET" \
+  --exclude "assets/*" \
+  --exclude ".vite/*" \
+  --cache-control "public,max-age=0,must-revalidate" \
+  --delete
+
+if [ -n "${CLOUDFRONT_DISTRIBUTION_ID:-}" ]; then
+  aws cloudfront create-invalidation \
+    --distribution-id "$CLOUDFRONT_DISTRIBUTION_ID" \
+    --paths "/*"
+fi
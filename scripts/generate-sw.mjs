@@ -0,0 +1,41 @@
+// Writes dist/sw.js from scripts/sw-template.js with the list of files to
+// precache for this build. Runs after `vite build` (and after prerendering in
+// `npm run build:ssg`, so the prerendered pages are precached too).
+import { createHash } from 'node:crypto';
+import { readdir, readFile, writeFile } from 'node:fs/promises';
+import path from 'node:path';
+import { fileURLToPath } from 'node:url';
+
+const root = fileURLToPath(new URL('..', import.meta.url));
+const dist = path.join(root, 'dist');
+
+// Build metadata stays out, and photos are cached on demand instead of up front.
+const skip = [/^\.vite\//, /^sw\.js$/, /^chunk-manifest\.json$/, /^assets\/images\//];
+
+async function listFiles(dir, prefix = '') {
+  const entries = await readdir(dir, { withFileTypes: true });
+  const nested = await Promise.all(
+    entries.map((entry) => {
+      const rel = `${prefix}${entry.name}`;
+      if (entry.isDirectory()) return listFiles(path.join(dir, entry.name), `${rel}/`);
+      return skip.some((pattern) => pattern.test(rel)) ? [] : [rel];
+    }),
+  );
+  return nested.flat();
+}
+
+const files = (await listFiles(dist)).sort();
+const hash = createHash('sha256');
+for (const file of files) {
+  hash.update(file);
+  hash.update(await readFile(path.join(dist, file)));
+}
+const version = hash.digest('hex').slice(0, 12);
+const urls = files.map((file) => `/${file}`);
+
+const template = await readFile(path.join(root, 'scripts', 'sw-template.js'), 'utf8');
+await writeFile(
+  path.join(dist, 'sw.js'),
+  `const VERSION = ${JSON.stringify(version)};\nconst PRECACHE_URLS = ${JSON.stringify(urls)};\n\n${template}`,
+);
+console.log(`sw.js: precaching ${urls.length} files (version ${version})`);
@@ -0,0 +1,369 @@
+// Imports posts from an Instagram data download (Settings > Your activity >
+// Download your information, JSON format) into the gallery:
+//
+//   npm run ingest:instagram -- <export.zip | extracted folder> [--full]
+//
+// - Posts are read from content/posts_*.json as a stream, one post at a time.
+// - Hashtags are mapped to categories with src/data/hashtag-categories.json;
+//   posts without a mapped hashtag, and video-only posts, are skipped.
+// - Only posts newer than the newest one already imported are considered
+//   (--full rescans everything), and posts are deduped on their Instagram id.
+// - The photo of each new post is copied to src/assets/images/gallery/, and the
+//   post is added to src/data/gallery/<category>.json.
+// - src/data/gallery/all-<n>.json are rewritten from the category shards: every
+//   post once, newest first, ALL_PAGE_SIZE per page.
+//
+// Zip archives are read through their central directory. Only the posts JSON
+// and the photos of new posts are decompressed, so re-running on a
+// multi-gigabyte export takes seconds.
+import { createReadStream, createWriteStream, existsSync } from 'node:fs';
+import { mkdir, open, readdir, readFile, rename, rm, stat, writeFile } from 'node:fs/promises';
+import path from 'node:path';
+import { Readable } from 'node:stream';
+import { pipeline } from 'node:stream/promises';
+import { fileURLToPath } from 'node:url';
+import { createInflateRaw } from 'node:zlib';
+
+const root = fileURLToPath(new URL('..', import.meta.url));
+const shardDir = path.join(root, 'src', 'data', 'gallery');
+const imageDir = path.join(root, 'src', 'assets', 'images', 'gallery');
+const categoryForTag = JSON.parse(await readFile(path.join(root, 'src', 'data', 'hashtag-categories.json'), 'utf8'));
+const categories = [...new Set(Object.values(categoryForTag))];
+// Same as galleryPageSize in src/data/gallery.ts: one page per scroll step.
+const ALL_PAGE_SIZE = 24;
+
+// Formats src/components/ResponsiveImage.tsx can be built from (see plugins/responsiveImages.ts).
+const PHOTO = /\.(jpe?g|png|webp)$/i;
+const POSTS_FILE = /(^|\/)posts_\d+\.json$/;
+
+// --- export sources ----------------------------------------------------------
+
+async function openDirectory(dir) {
+  const names = [];
+  async function walk(rel) {
+    for (const entry of await readdir(path.join(dir, rel), { withFileTypes: true })) {
+      const name = rel ? `${rel}/${entry.name}` : entry.name;
+      if (entry.isDirectory()) await walk(name);
+      else names.push(name);
+    }
+  }
+  await walk('');
+  return {
+    names,
+    open: async (name) => createReadStream(path.join(dir, name)),
+    close: async () => {},
+  };
+}
+
+const ZIP_EOCD = 0x06054b50;
+const ZIP64_LOCATOR = 0x07064b50;
+const ZIP_CENTRAL_HEADER = 0x02014b50;
+const ZIP64_EXTRA = 0x0001;
+const U32_MAX = 0xffffffff;
+
+/** Minimal zip reader: lists entries from the central directory and streams single entries. */
+async function openZip(file) {
+  const handle = await open(file, 'r');
+  const { size } = await handle.stat();
+  const read = async (position, length) => {
+    const buffer = Buffer.alloc(length);
+    await handle.read(buffer, 0, length, position);
+    return buffer;
+  };
+
+  // The end-of-central-directory record is 22 bytes plus a comment of up to 64 KiB.
+  const tailStart = Math.max(0, size - 22 - 0xffff);
+  const tail = await read(tailStart, size - tailStart);
+  let eocd = -1;
+  for (let i = tail.length - 22; i >= 0 && eocd < 0; i--) if (tail.readUInt32LE(i) === ZIP_EOCD) eocd = i;
+  if (eocd < 0) throw new Error(`${file} is not a zip archive`);
+
+  let count = tail.readUInt16LE(eocd + 10);
+  let directorySize = tail.readUInt32LE(eocd + 12);
+  let directoryOffset = tail.readUInt32LE(eocd + 16);
+
+  // Exports over 4 GiB or with more than 65,535 files keep the real values in a ZIP64 record.
+  if (count === 0xffff || directorySize === U32_MAX || directoryOffset === U32_MAX) {
+    const locator = eocd >= 20 ? tail.subarray(eocd - 20, eocd) : await read(tailStart + eocd - 20, 20);
+    if (locator.readUInt32LE(0) !== ZIP64_LOCATOR) throw new Error(`${file}: missing ZIP64 locator`);
+    const record = await read(Number(locator.readBigUInt64LE(8)), 56);
+    count = Number(record.readBigUInt64LE(32));
+    directorySize = Number(record.readBigUInt64LE(40));
+    directoryOffset = Number(record.readBigUInt64LE(48));
+  }
+
+  const directory = await read(directoryOffset, directorySize);
+  const entries = new Map();
+  for (let p = 0, i = 0; i < count; i++) {
+    if (directory.readUInt32LE(p) !== ZIP_CENTRAL_HEADER) throw new Error(`${file}: corrupt central directory`);
+    const method = directory.readUInt16LE(p + 10);
+    let compressedSize = directory.readUInt32LE(p + 20);
+    let uncompressedSize = directory.readUInt32LE(p + 24);
+    const nameLength = directory.readUInt16LE(p + 28);
+    const extraLength = directory.readUInt16LE(p + 30);
+    const commentLength = directory.readUInt16LE(p + 32);
+    let offset = directory.readUInt32LE(p + 42);
+    const name = directory.toString('utf8', p + 46, p + 46 + nameLength);
+
+    const extra = directory.subarray(p + 46 + nameLength, p + 46 + nameLength + extraLength);
+    for (let e = 0; e + 4 <= extra.length; e += 4 + extra.readUInt16LE(e + 2)) {
+      if (extra.readUInt16LE(e) !== ZIP64_EXTRA) continue;
+      let q = e + 4;
+      const next = () => {
+        const value = Number(extra.readBigUInt64LE(q));
+        q += 8;
+        return value;
+      };
+      if (uncompressedSize === U32_MAX) uncompressedSize = next();
+      if (compressedSize === U32_MAX) compressedSize = next();
+      if (offset === U32_MAX) offset = next();
+    }
+
+    if (!name.endsWith('/')) entries.set(name, { method, compressedSize, offset });
+    p += 46 + nameLength + extraLength + commentLength;
+  }
+
+  return {
+    names: [...entries.keys()],
+    async open(name) {
+      const entry = entries.get(name);
+      // Local header: 30 bytes, then a name and extra field whose lengths may differ from the central copy.
+      const local = await read(entry.offset, 30);
+      const start = entry.offset + 30 + local.readUInt16LE(26) + local.readUInt16LE(28);
+      if (entry.compressedSize === 0) return Readable.from([]);
+      const raw = createReadStream(file, { start, end: start + entry.compressedSize - 1 });
+      if (entry.method === 0) return raw;
+      if (entry.method !== 8) throw new Error(`${name}: unsupported zip compression method ${entry.method}`);
+      const inflate = createInflateRaw();
+      raw.on('error', (error) => inflate.destroy(error));
+      return raw.pipe(inflate);
+    },
+    close: () => handle.close(),
+  };
+}
+
+// --- streaming JSON ----------------------------------------------------------
+
+/**
+ * Yields the elements of the first JSON array in a stream, parsing one
+ * element at a time. Handles both `[...]` and `{ "key": [...] }` layouts.
+ */
+async function* jsonArrayElements(stream) {
+  let depth = 0;
+  let arrayDepth = -1;
+  let inString = false;
+  let escaped = false;
+  let pending = '';
+  let collecting = false;
+
+  stream.setEncoding('utf8');
+  for await (const chunk of stream) {
+    let start = collecting ? 0 : -1;
+    for (let i = 0; i < chunk.length; i++) {
+      const c = chunk[i];
+      if (inString) {
+        if (escaped) escaped = false;
+        else if (c === '\\') escaped = true;
+        else if (c === '"') inString = false;
+        continue;
+      }
+      if (c === '"') {
+        inString = true;
+      } else if (c === '{' || c === '[') {
+        depth++;
+        if (arrayDepth < 0 && c === '[') arrayDepth = depth;
+        else if (depth === arrayDepth + 1) {
+          start = i;
+          collecting = true;
+        }
+      } else if (c === '}' || c === ']') {
+        depth--;
+        if (collecting && depth === arrayDepth) {
+          yield JSON.parse(pending + chunk.slice(start, i + 1));
+          pending = '';
+          collecting = false;
+          start = -1;
+        } else if (depth < arrayDepth) {
+          return;
+        }
+      }
+    }
+    if (collecting) pending += chunk.slice(start);
+  }
+}
+
+// --- posts -------------------------------------------------------------------
+
+// Instagram writes UTF-8 text as one \u00XX escape per byte, which turns Farsi
+// captions into mojibake unless the bytes are reassembled.
+function fixEncoding(text) {
+  return /[\u0080-\u00ff]/.test(text) && !/[^\u0000-\u00ff]/.test(text)
+    ? Buffer.from(text, 'latin1').toString('utf8')
+    : text;
+}
+
+function titleFrom(caption) {
+  const line = caption
+    .replace(/#[\p{L}\p{N}_]+/gu, '')
+    .split('\n')
+    .map((l) => l.replace(/\s+/g, ' ').trim())
+    .find(Boolean);
+  if (!line) return undefined;
+  return line.length > 80 ? `${line.slice(0, 79).trimEnd()}…` : line;
+}
+
+/** Normalizes one export post, or returns undefined when it has no photo. */
+function parsePost(raw) {
+  const photo = (raw.media ?? []).find((m) => typeof m?.uri === 'string' && PHOTO.test(m.uri));
+  if (!photo) return undefined;
+  const caption = fixEncoding(raw.title || photo.title || '');
+  const timestamp = raw.creation_timestamp ?? photo.creation_timestamp;
+  const tags = [...new Set([...caption.matchAll(/#([\p{L}\p{N}_]+)/gu)].map((m) => m[1].toLowerCase()))];
+
+  return {
+    // The media file name is the only stable id in the export.
+    id: path.posix.basename(photo.uri).replace(/\.\w+$/, ''),
+    tags,
+    title: titleFrom(caption),
+    uri: photo.uri,
+    date: timestamp ? new Date(timestamp * 1000).toISOString() : undefined,
+  };
+}
+
+// --- gallery store -------------------------------------------------------------
+
+async function readShards() {
+  const shards = new Map();
+  for (const category of categories) {
+    const file = path.join(shardDir, `${category}.json`);
+    shards.set(category, existsSync(file) ? JSON.parse(await readFile(file, 'utf8')) : []);
+  }
+  return shards;
+}
+
+// The order the gallery shows: newest first, hand-written items without a date by id.
+function newestFirst(a, b) {
+  return (b.date ?? '').localeCompare(a.date ?? '') || a.id.localeCompare(b.id, undefined, { numeric: true });
+}
+
+// One item per line keeps the shards compact and their diffs readable.
+const formatShard = (items) => `[\n${items.map((item) => JSON.stringify(item)).join(',\n')}\n]\n`;
+
+// "All" reads these pages instead of every category shard, so it downloads
+// each post once and only as far as the visitor scrolls.
+async function writeAllPages(shards) {
+  const unique = new Map([...shards.values()].flat().map((item) => [item.id, item]));
+  const items = [...unique.values()].sort(newestFirst);
+  const count = Math.ceil(items.length / ALL_PAGE_SIZE);
+  for (let page = 0; page < count; page++) {
+    const slice = items.slice(page * ALL_PAGE_SIZE, (page + 1) * ALL_PAGE_SIZE);
+    await writeFile(path.join(shardDir, `all-${page}.json`), formatShard(slice));
+  }
+  for (const name of await readdir(shardDir)) {
+    const page = /^all-(\d+)\.json$/.exec(name);
+    if (page && Number(page[1]) >= count) await rm(path.join(shardDir, name));
+  }
+  return count;
+}
+
+async function extract(source, name, target) {
+  const partial = `${target}.partial`;
+  await pipeline(await source.open(name), createWriteStream(partial));
+  await rename(partial, target);
+}
+
+// --- main ----------------------------------------------------------------------
+
+const args = process.argv.slice(2);
+const input = args.find((arg) => !arg.startsWith('--'));
+const full = args.includes('--full');
+if (!input) {
+  console.error('usage: npm run ingest:instagram -- <export.zip | export folder> [--full]');
+  process.exit(1);
+}
+
+const started = performance.now();
+const source = (await stat(input)).isDirectory() ? await openDirectory(input) : await openZip(input);
+const names = new Set(source.names);
+const postFiles = source.names.filter((name) => POSTS_FILE.test(name)).sort();
+if (postFiles.length === 0) {
+  console.error(`no posts_*.json found in ${input}; was the download requested in JSON format?`);
+  process.exit(1);
+}
+
+const shards = await readShards();
+const known = new Set([...shards.values()].flat().map((item) => item.id));
+const since = full
+  ? ''
+  : [...shards.values()]
+      .flat()
+      .map((item) => item.date ?? '')
+      .reduce((a, b) => (a > b ? a : b), '');
+
+const counts = { scanned: 0, older: 0, duplicate: 0, uncategorized: 0, noPhoto: 0, added: 0 };
+const changed = new Set();
+await mkdir(imageDir, { recursive: true });
+
+try {
+  for (const postsFile of postFiles) {
+    // Media URIs are relative to the export root, which may sit inside a top-level folder.
+    const contentAt = postsFile.search(/(your_instagram_activity\/)?content\/posts_\d+\.json$/);
+    const prefix = contentAt > 0 ? postsFile.slice(0, contentAt) : '';
+
+    for await (const raw of jsonArrayElements(await source.open(postsFile))) {
+      counts.scanned++;
+      const post = parsePost(raw);
+      if (!post) {
+        counts.noPhoto++;
+        continue;
+      }
+      if (since && post.date && post.date <= since) {
+        counts.older++;
+        continue;
+      }
+      if (known.has(post.id)) {
+        counts.duplicate++;
+        continue;
+      }
+      const postCategories = [...new Set(post.tags.map((tag) => categoryForTag[tag]).filter(Boolean))];
+      if (postCategories.length === 0) {
+        counts.uncategorized++;
+        continue;
+      }
+      const mediaName = `${prefix}${post.uri}`;
+      if (!names.has(mediaName)) {
+        counts.noPhoto++;
+        continue;
+      }
+
+      const extension = path.extname(post.uri).toLowerCase();
+      const target = path.join(imageDir, `${post.id}${extension}`);
+      if (!existsSync(target)) await extract(source, mediaName, target);
+
+      const item = { id: post.id, tags: post.tags, title: post.title, image: post.id, date: post.date };
+      for (const category of postCategories) {
+        shards.get(category).push(item);
+        changed.add(category);
+      }
+      known.add(post.id);
+      counts.added++;
+    }
+  }
+} finally {
+  await source.close();
+}
+
+await mkdir(shardDir, { recursive: true });
+for (const category of changed) {
+  await writeFile(path.join(shardDir, `${category}.json`), formatShard(shards.get(category).sort(newestFirst)));
+}
+const allPages = await writeAllPages(shards);
+
+const seconds = ((performance.now() - started) / 1000).toFixed(1);
+console.log(
+  `${counts.added} new post(s) from ${counts.scanned} scanned in ${seconds}s` +
+    ` (${counts.older} older than the last import, ${counts.duplicate} duplicate,` +
+    ` ${counts.uncategorized} without a category hashtag, ${counts.noPhoto} without a photo)`,
+);
+if (changed.size > 0) console.log(`updated src/data/gallery/{${[...changed].sort().join(',')}}.json`);
+console.log(`wrote ${allPages} page(s) of src/data/gallery/all-<n>.json`);
@@ -0,0 +1,63 @@
+// Prerenders every route in every language into dist/ after the client and
+// SSR builds have run (see `npm run build:ssg`):
+//
+//   /            -> dist/index.html          /fa/          -> dist/fa/index.html
+//   /gallery     -> dist/gallery/index.html  /fa/gallery   -> dist/fa/gallery/index.html
+//
+// The untouched client shell is kept as dist/spa.html for unknown URLs.
+import { mkdir, readFile, writeFile } from 'node:fs/promises';
+import path from 'node:path';
+import { fileURLToPath, pathToFileURL } from 'node:url';
+
+const root = fileURLToPath(new URL('..', import.meta.url));
+const dist = path.join(root, 'dist');
+const ssrEntry = path.join(root, 'dist-ssr', 'entry-server.js');
+
+const template = await readFile(path.join(dist, 'index.html'), 'utf8');
+const manifest = JSON.parse(await readFile(path.join(dist, '.vite', 'manifest.json'), 'utf8'));
+const { render, pages, languages, isRtl } = await import(pathToFileURL(ssrEntry).href);
+
+// JS chunks a manifest entry needs, beyond what the entry chunk already preloads.
+function chunkFiles(key, seen = new Set()) {
+  const chunk = manifest[key];
+  if (!chunk || seen.has(chunk.file)) return seen;
+  seen.add(chunk.file);
+  for (const imported of chunk.imports ?? []) chunkFiles(imported, seen);
+  return seen;
+}
+
+const entryFiles = chunkFiles('index.html');
+
+// Pages follow the src/pages/<Ns>.tsx naming used by src/routes.ts.
+function preloadLinks({ ns }, lng) {
+  const keys = [
+    `src/pages/${ns[0].toUpperCase()}${ns.slice(1)}.tsx`,
+    `src/locales/${lng}/common.json`,
+    `src/locales/${lng}/${ns}.json`,
+    // the data shard the page reads on first render; later pages load on scroll
+    `src/data/${ns}/all-0.json`,
+  ];
+
+  const files = new Set();
+  for (const key of keys) for (const file of chunkFiles(key)) if (!entryFiles.has(file)) files.add(file);
+  return [...files].map((file) => `    <link rel="modulepreload" crossorigin href="/${file}">`).join('\n');
+}
+
+await writeFile(path.join(dist, 'spa.html'), template);
+
+for (const lng of languages) {
+  for (const page of pages) {
+    const routePath = page.path;
+    const markup = await render(routePath, lng);
+    const html = template
+      .replace('<html lang="en">', `<html lang="${lng}" dir="${isRtl(lng) ? 'rtl' : 'ltr'}">`)
+      .replace('</head>', `${preloadLinks(page, lng)}\n  </head>`)
+      .replace('<div id="root"></div>', `<div id="root">${markup}</div>`);
+
+    const urlPath = lng === 'en' ? routePath : `/${lng}${routePath}`;
+    const outDir = path.join(dist, urlPath);
+    await mkdir(outDir, { recursive: true });
+    await writeFile(path.join(outDir, 'index.html'), html);
+    console.log(`prerendered ${urlPath}`);
+  }
+}
@@ -0,0 +1,113 @@
+/* global self, caches, PRECACHE_URLS, VERSION */
+// Service worker template; scripts/generate-sw.mjs prepends PRECACHE_URLS and
+// VERSION for the current build and writes the result to dist/sw.js.
+//
+// - App shell, prerendered HTML and hashed JS/CSS/locale chunks are precached
+//   per deploy, so repeat visits render without a network round-trip.
+// - Same-origin images are served stale-while-revalidate from a cache
+//   capped at MAX_IMAGE_ENTRIES, evicting the least recently used.
+// - A new deploy installs next to the old one and only takes over once no
+//   page is running the old version, or when a hidden page that is the only
+//   one open asks it to (see src/registerServiceWorker.ts). Each deploy's
+//   precache is complete on its own, so a cold start never mixes chunks from
+//   two deploys. The previous deploy's precache is kept until the next
+//   activation, so the page that let the new worker take over can still
+//   lazy-load its own chunks offline.
+
+const PRECACHE = `precache-${VERSION}`;
+const IMAGE_CACHE = 'images';
+const MAX_IMAGE_ENTRIES = 200;
+
+const precached = new Set(PRECACHE_URLS);
+
+self.addEventListener('install', (event) => {
+  event.waitUntil(
+    caches.open(PRECACHE).then((cache) =>
+      cache.addAll(PRECACHE_URLS.map((url) => new Request(url, { cache: 'reload' }))),
+    ),
+  );
+});
+
+self.addEventListener('activate', (event) => {
+  event.waitUntil(
+    caches
+      .keys()
+      .then((keys) => {
+        // keys() lists caches in creation order; keep only the newest older precache.
+        const previous = keys.filter((key) => key.startsWith('precache-') && key !== PRECACHE);
+        return Promise.all(previous.slice(0, -1).map((key) => caches.delete(key)));
+      })
+      .then(() => self.clients.claim()),
+  );
+});
+
+self.addEventListener('message', (event) => {
+  if (event.data !== 'SKIP_WAITING') return;
+  // Any other open page may still be running the old build and need its chunks.
+  // A waiting worker controls no page, so uncontrolled ones must be listed too.
+  event.waitUntil(
+    self.clients.matchAll({ type: 'window', includeUncontrolled: true }).then((clients) => {
+      if (clients.length === 1 && clients[0].id === event.source?.id) return self.skipWaiting();
+    }),
+  );
+});
+
+// Prerendered pages live at /<route>/index.html; plain builds only have the shell.
+function htmlFor(pathname) {
+  const candidates = [pathname.endsWith('/') ? `${pathname}index.html` : `${pathname}/index.html`, '/spa.html', '/index.html'];
+  return candidates.find((url) => precached.has(url));
+}
+
+async function fromPrecache(url, request) {
+  const cached = await caches.match(url, { cacheName: PRECACHE });
+  return cached ?? fetch(request);
+}
+
+async function trimImages(cache) {
+  const keys = await cache.keys();
+  const excess = keys.length - MAX_IMAGE_ENTRIES;
+  // cache.put() re-appends an entry, so keys() is ordered least recently used first.
+  await Promise.all(keys.slice(0, Math.max(0, excess)).map((key) => cache.delete(key)));
+}
+
+async function staleWhileRevalidate(event) {
+  const cache = await caches.open(IMAGE_CACHE);
+  const cached = await cache.match(event.request);
+  const refresh = fetch(event.request).then(async (response) => {
+    if (response.ok) {
+      await cache.put(event.request, response.clone());
+      await trimImages(cache);
+    }
+    return response;
+  });
+  if (cached) {
+    event.waitUntil(refresh.catch(() => undefined));
+    return cached;
+  }
+  return refresh;
+}
+
+self.addEventListener('fetch', (event) => {
+  const { request } = event;
+  if (request.method !== 'GET') return;
+  const url = new URL(request.url);
+
+  if (url.origin !== self.location.origin || url.pathname.startsWith('/api/')) return;
+
+  if (request.destination === 'image') {
+    event.respondWith(staleWhileRevalidate(event));
+    return;
+  }
+
+  if (request.mode === 'navigate') {
+    const html = htmlFor(url.pathname);
+    if (html) event.respondWith(fromPrecache(html, request));
+    return;
+  }
+  if (precached.has(url.pathname)) {
+    event.respondWith(fromPrecache(url.pathname, request));
+  } else if (url.pathname.startsWith('/assets/')) {
+    // a hashed chunk from the previous deploy, requested by a page still running it
+    event.respondWith(caches.match(request).then((cached) => cached ?? fetch(request)));
+  }
+});
@@ -0,0 +1,64 @@
+import { appendFile } from 'node:fs/promises';
+
+const BATCH_SIZE = 25;
+const INTERVAL_MS = 1000;
+const MAX_ATTEMPTS = 8;
+const MAX_BACKOFF_MS = 5 * 60 * 1000;
+
+/**
+ * Drains the queue in batches. A failed batch is retried with exponential
+ * backoff; after MAX_ATTEMPTS its items move to the dead-letter file so one
+ * bad message cannot stall the rest.
+ */
+export function startDelivery({ queue, mailer, deadLetterFile, onDelivered = () => {}, onFailed = () => {} }) {
+  const attempts = new Map();
+  let running = false;
+
+  const due = (item) => (attempts.get(item.id)?.retryAt ?? 0) <= Date.now();
+
+  async function tick() {
+    if (running) return;
+    running = true;
+    try {
+      let batch;
+      while ((batch = queue.peek(BATCH_SIZE, due)).length > 0) {
+        try {
+          await mailer.sendBatch(batch);
+          await queue.ack(batch.map((item) => item.id));
+          batch.forEach((item) => attempts.delete(item.id));
+          onDelivered(batch.length);
+        } catch (error) {
+          onFailed(batch.length, error);
+          const dead = [];
+          for (const item of batch) {
+            const count = (attempts.get(item.id)?.count ?? 0) + 1;
+            if (count >= MAX_ATTEMPTS) {
+              dead.push(item);
+              attempts.delete(item.id);
+            } else {
+              attempts.set(item.id, { count, retryAt: Date.now() + Math.min(MAX_BACKOFF_MS, 1000 * 2 ** count) });
+            }
+          }
+          if (dead.length > 0) {
+            await appendFile(deadLetterFile, dead.map((item) => `${JSON.stringify(item)}\n`).join(''));
+            await queue.ack(dead.map((item) => item.id));
+          }
+        }
+      }
+    } catch (error) {
+      // An ack or dead-letter write failed (disk full, EIO). Log it and keep
+      // the API up: the journal still lists those items as pending, so the
+      // worst case is a re-delivery after a restart.
+      console.error(`contact delivery stalled: ${error.message}`);
+    } finally {
+      running = false;
+    }
+  }
+
+  const timer = setInterval(() => void tick(), INTERVAL_MS);
+  return {
+    /** Delivers right away instead of waiting for the next tick, e.g. when a batch fills up. */
+    kick: () => void tick(),
+    stop: () => clearInterval(timer),
+  };
+}
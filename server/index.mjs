@@ -0,0 +1,132 @@
+// Local API for the site. Stands in for the production backend during
+// development and in `vite preview`, where /api is proxied here.
+//
+//   POST /api/contact        validate, persist to the on-disk queue, 202
+//   GET  /api/contact/stats  queue depth and throughput
+//   POST /api/metrics        real-user metrics beacon, appended to metrics.jsonl
+//   GET  /api/metrics        p75 per metric, route and language
+//
+//   API_PORT (default 8787, also read by the proxy in vite.config.ts), DATA_DIR (default ./.data)
+import { createServer } from 'node:http';
+import path from 'node:path';
+import { fileURLToPath } from 'node:url';
+import { startDelivery } from './delivery.mjs';
+import { createMockMailer } from './mailer.mjs';
+import { createMetricsStore, sanitizeMetrics } from './metrics.mjs';
+import { DurableQueue } from './queue.mjs';
+import { validateSubmission } from './validate.mjs';
+
+const root = fileURLToPath(new URL('..', import.meta.url));
+const PORT = Number(process.env.API_PORT ?? 8787);
+const DATA_DIR = path.resolve(root, process.env.DATA_DIR ?? '.data');
+const MAX_BODY_BYTES = 16 * 1024;
+const MAX_METRICS_BYTES = 64 * 1024;
+
+/** Events per second over the last minute, in one-second buckets. */
+function createRate() {
+  const buckets = new Array(60).fill(0);
+  let current = Math.floor(Date.now() / 1000);
+  let total = 0;
+
+  const advance = () => {
+    const now = Math.floor(Date.now() / 1000);
+    for (let s = current + 1; s <= Math.min(now, current + 60); s++) buckets[s % 60] = 0;
+    current = Math.max(current, now);
+  };
+
+  return {
+    add(n = 1) {
+      advance();
+      buckets[current % 60] += n;
+      total += n;
+    },
+    snapshot() {
+      advance();
+      const lastMinute = buckets.reduce((sum, n) => sum + n, 0);
+      return { total, lastMinute, perSecond: Number((lastMinute / 60).toFixed(2)) };
+    },
+  };
+}
+
+const rates = { accepted: createRate(), delivered: createRate(), failed: createRate() };
+
+const metrics = createMetricsStore(path.join(DATA_DIR, 'metrics.jsonl'));
+
+const queue = new DurableQueue(path.join(DATA_DIR, 'contact-queue.jsonl'));
+await queue.open();
+
+const delivery = startDelivery({
+  queue,
+  mailer: createMockMailer(DATA_DIR),
+  deadLetterFile: path.join(DATA_DIR, 'contact-dead-letter.jsonl'),
+  onDelivered: (n) => rates.delivered.add(n),
+  onFailed: (n, error) => {
+    rates.failed.add(n);
+    console.warn(`contact delivery failed for ${n} item(s): ${error.message}`);
+  },
+});
+
+function send(res, status, body) {
+  res.writeHead(status, { 'Content-Type': 'application/json', 'Cache-Control': 'no-store' });
+  res.end(JSON.stringify(body));
+}
+
+async function readJson(req, limit = MAX_BODY_BYTES) {
+  let size = 0;
+  const chunks = [];
+  for await (const chunk of req) {
+    size += chunk.length;
+    if (size > limit) throw Object.assign(new Error('payload too large'), { status: 413 });
+    chunks.push(chunk);
+  }
+  try {
+    return JSON.parse(Buffer.concat(chunks).toString('utf8'));
+  } catch {
+    throw Object.assign(new Error('invalid JSON'), { status: 400 });
+  }
+}
+
+const routes = {
+  'POST /api/contact': async (req, res) => {
+    const { submission, errors } = validateSubmission(await readJson(req));
+    if (errors) return send(res, 422, { errors });
+    const queued = await queue.enqueue(submission);
+    if (queued) rates.accepted.add();
+    if (queue.depth >= 25) delivery.kick();
+    send(res, 202, { id: submission.id, status: 'queued' });
+  },
+  'GET /api/contact/stats': (_req, res) => {
+    send(res, 200, {
+      queueDepth: queue.depth,
+      accepted: rates.accepted.snapshot(),
+      delivered: rates.delivered.snapshot(),
+      failed: rates.failed.snapshot(),
+    });
+  },
+  'POST /api/metrics': async (req, res) => {
+    await metrics.append(sanitizeMetrics(await readJson(req, MAX_METRICS_BYTES)));
+    res.writeHead(204).end();
+  },
+  'GET /api/metrics': async (_req, res) => {
+    send(res, 200, await metrics.summary());
+  },
+};
+
+const server = createServer((req, res) => {
+  const handler = routes[`${req.method} ${new URL(req.url, 'http://localhost').pathname}`];
+  if (!handler) return send(res, 404, { error: 'not found' });
+  Promise.resolve(handler(req, res)).catch((error) => {
+    if (!error.status) console.error(error);
+    send(res, error.status ?? 500, { error: error.status ? error.message : 'internal error' });
+  });
+});
+
+server.listen(PORT, () => console.log(`api listening on http://localhost:${PORT} (data in ${DATA_DIR})`));
+
+for (const signal of ['SIGINT', 'SIGTERM']) {
+  process.on(signal, () => {
+    delivery.stop();
+    server.close();
+    void queue.close().then(() => process.exit(0));
+  });
+}
@@ -0,0 +1,20 @@
+import { appendFile, mkdir } from 'node:fs/promises';
+import path from 'node:path';
+
+/**
+ * Stand-in for the real mail/booking provider: every delivered batch is
+ * appended to `outbox.jsonl`. Set MOCK_MAIL_FAILURE_RATE (0-1) to make a
+ * share of batches fail and exercise the retry path.
+ */
+export function createMockMailer(dataDir, failureRate = Number(process.env.MOCK_MAIL_FAILURE_RATE ?? 0)) {
+  const outbox = path.join(dataDir, 'outbox.jsonl');
+
+  return {
+    async sendBatch(items) {
+      if (Math.random() < failureRate) throw new Error('mock mailer: simulated outage');
+      await mkdir(dataDir, { recursive: true });
+      const sentAt = new Date().toISOString();
+      await appendFile(outbox, items.map((item) => `${JSON.stringify({ ...item, sentAt })}\n`).join(''));
+    },
+  };
+}
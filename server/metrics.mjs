@@ -0,0 +1,78 @@
+// Real-user metrics collector. Beacons from src/vitals.ts are appended to a
+// JSON-lines file; the summary reads it back and reports p75 per metric,
+// route and language, which is how Core Web Vitals are assessed.
+import { createReadStream } from 'node:fs';
+import { appendFile, mkdir } from 'node:fs/promises';
+import path from 'node:path';
+import { createInterface } from 'node:readline';
+
+const NAMES = new Set(['LCP', 'INP', 'CLS', 'TTFB', 'route-transition', 'language-switch']);
+const LANGS = new Set(['en', 'fa']);
+const MAX_RECORDS_PER_BATCH = 100;
+
+/** Keeps well-formed records and drops the rest; beacons get no error response to act on anyway. */
+export function sanitizeMetrics(body) {
+  if (!Array.isArray(body)) return [];
+  const receivedAt = new Date().toISOString();
+  return body.slice(0, MAX_RECORDS_PER_BATCH).flatMap((record) => {
+    if (!record || typeof record !== 'object') return [];
+    const { name, value, route, lang, session, at } = record;
+    if (!NAMES.has(name) || !Number.isFinite(value) || value < 0) return [];
+    if (typeof route !== 'string' || !route.startsWith('/') || route.length > 200) return [];
+    return [
+      {
+        name,
+        value,
+        route,
+        lang: LANGS.has(lang) ? lang : 'other',
+        session: typeof session === 'string' ? session.slice(0, 64) : undefined,
+        at: Number.isFinite(at) ? at : undefined,
+        receivedAt,
+      },
+    ];
+  });
+}
+
+function p75(values) {
+  const sorted = values.sort((a, b) => a - b);
+  return sorted[Math.min(sorted.length - 1, Math.ceil(sorted.length * 0.75) - 1)];
+}
+
+export function createMetricsStore(file) {
+  let ready;
+
+  return {
+    async append(records) {
+      if (records.length === 0) return;
+      ready ??= mkdir(path.dirname(file), { recursive: true });
+      await ready;
+      await appendFile(file, records.map((r) => JSON.stringify(r)).join('\n') + '\n');
+    },
+
+    /** `{ [name]: { [route]: { [lang]: { p75, count } } } }` */
+    async summary() {
+      const groups = new Map();
+      try {
+        const lines = createInterface({ input: createReadStream(file), crlfDelay: Infinity });
+        for await (const line of lines) {
+          if (!line) continue;
+          const { name, route, lang, value } = JSON.parse(line);
+          const key = `${name}\n${route}\n${lang}`;
+          if (!groups.has(key)) groups.set(key, []);
+          groups.get(key).push(value);
+        }
+      } catch (error) {
+        if (error.code !== 'ENOENT') throw error;
+      }
+
+      const result = {};
+      for (const [key, values] of groups) {
+        const [name, route, lang] = key.split('\n');
+        result[name] ??= {};
+        result[name][route] ??= {};
+        result[name][route][lang] = { p75: p75(values), count: values.length };
+      }
+      return result;
+    },
+  };
+}
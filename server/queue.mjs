@@ -0,0 +1,161 @@
+import { mkdir, open, readFile, rename } from 'node:fs/promises';
+import path from 'node:path';
+
+const COMPACT_RETRY_MS = 60 * 1000;
+
+/**
+ * Append-only, fsync'd on-disk queue. Every `enqueue`/`ack` is a JSON line in
+ * the journal; the pending set is rebuilt by replaying it on start. Writes
+ * issued while a flush is in progress are group-committed in the next one, so
+ * a burst of submissions costs one fsync per flush rather than one each.
+ */
+export class DurableQueue {
+  #file;
+  #handle;
+  #pending = new Map();
+  #seen = new Set();
+  #writing = new Map();
+  #buffer = [];
+  #flushing;
+  #acked = 0;
+  #compactAfter = 0;
+
+  constructor(file) {
+    this.#file = file;
+  }
+
+  get depth() {
+    return this.#pending.size;
+  }
+
+  async open() {
+    await mkdir(path.dirname(this.#file), { recursive: true });
+    const journal = await readFile(this.#file, 'utf8').catch(() => '');
+    for (const line of journal.split('\n')) {
+      if (!line) continue;
+      let record;
+      try {
+        record = JSON.parse(line);
+      } catch {
+        continue; // torn final line from a crash mid-write
+      }
+      if (record.op === 'enqueue') {
+        this.#pending.set(record.item.id, record.item);
+        this.#seen.add(record.item.id);
+      } else if (record.op === 'ack') {
+        for (const id of record.ids) this.#pending.delete(id);
+        this.#acked += record.ids.length;
+      }
+    }
+    this.#handle = await open(this.#file, 'a');
+  }
+
+  /**
+   * Resolves once the item is durable. Re-sent ids are accepted but not queued
+   * twice; a re-send that arrives while the first write is in flight waits for
+   * it. If the write fails the id is forgotten, so the client's retry is stored.
+   */
+  async enqueue(item) {
+    if (this.#seen.has(item.id)) {
+      await this.#writing.get(item.id);
+      return false;
+    }
+    this.#seen.add(item.id);
+    this.#pending.set(item.id, item);
+    const written = this.#append({ op: 'enqueue', item });
+    this.#writing.set(item.id, written);
+    try {
+      await written;
+    } catch (error) {
+      this.#seen.delete(item.id);
+      this.#pending.delete(item.id);
+      throw error;
+    } finally {
+      this.#writing.delete(item.id);
+    }
+    return true;
+  }
+
+  async ack(ids) {
+    if (ids.length === 0) return;
+    for (const id of ids) this.#pending.delete(id);
+    this.#acked += ids.length;
+    await this.#append({ op: 'ack', ids });
+  }
+
+  /** Oldest pending items first. */
+  peek(limit, filter = () => true) {
+    const items = [];
+    for (const item of this.#pending.values()) {
+      if (items.length >= limit) break;
+      if (filter(item)) items.push(item);
+    }
+    return items;
+  }
+
+  async close() {
+    await this.#flushing;
+    await this.#handle?.close();
+  }
+
+  #append(record) {
+    return new Promise((resolve, reject) => {
+      this.#buffer.push({ line: `${JSON.stringify(record)}\n`, resolve, reject });
+      this.#flushing ??= this.#flush();
+    });
+  }
+
+  async #flush() {
+    try {
+      while (this.#buffer.length > 0) {
+        const batch = this.#buffer;
+        this.#buffer = [];
+        try {
+          // Reopened here if a failed compaction left the journal closed.
+          this.#handle ??= await open(this.#file, 'a');
+          await this.#handle.appendFile(batch.map((w) => w.line).join(''));
+          await this.#handle.datasync();
+          batch.forEach((w) => w.resolve());
+        } catch (error) {
+          batch.forEach((w) => w.reject(error));
+        }
+        if (this.#acked > 1000 && this.#acked > this.#pending.size * 4 && Date.now() >= this.#compactAfter) {
+          try {
+            await this.#compact();
+          } catch (error) {
+            // The journal in place stays valid, just long; try again later.
+            this.#compactAfter = Date.now() + COMPACT_RETRY_MS;
+            console.error(`contact queue compaction failed: ${error.message}`);
+          }
+        }
+      }
+    } finally {
+      this.#flushing = undefined;
+    }
+  }
+
+  // Rewrites the journal with only the pending items once acks dominate it.
+  // Runs inside #flush, so no other write can interleave. Ids are only
+  // de-duplicated within the current journal generation.
+  async #compact() {
+    const tmp = `${this.#file}.tmp`;
+    const lines = [...this.#pending.values()].map((item) => `${JSON.stringify({ op: 'enqueue', item })}\n`);
+    const handle = await open(tmp, 'w');
+    try {
+      await handle.appendFile(lines.join(''));
+      await handle.datasync();
+    } finally {
+      await handle.close();
+    }
+    await this.#handle?.close();
+    this.#handle = undefined;
+    try {
+      await rename(tmp, this.#file);
+    } finally {
+      // Whichever journal is in place, the old or the compacted one, takes the next writes.
+      this.#handle = await open(this.#file, 'a');
+    }
+    this.#seen = new Set(this.#pending.keys());
+    this.#acked = 0;
+  }
+}
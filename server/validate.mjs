@@ -0,0 +1,37 @@
+const SUBJECTS = new Set(['workshop', 'catering', 'general', 'other']);
+const EMAIL = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+
+const limits = { name: 200, email: 254, phone: 40, message: 5000 };
+
+function text(value) {
+  return typeof value === 'string' ? value.trim() : '';
+}
+
+/**
+ * Normalizes a contact form payload. Returns `{ submission }` when valid or
+ * `{ errors }` keyed by field name.
+ */
+export function validateSubmission(body) {
+  const errors = {};
+  const submission = {
+    id: text(body?.id),
+    name: text(body?.name),
+    email: text(body?.email),
+    phone: text(body?.phone),
+    subject: text(body?.subject),
+    message: text(body?.message),
+    createdAt: text(body?.createdAt) || new Date().toISOString(),
+  };
+
+  if (!/^[\w-]{8,64}$/.test(submission.id)) errors.id = 'invalid';
+  if (!submission.name) errors.name = 'required';
+  if (!EMAIL.test(submission.email)) errors.email = 'invalid';
+  if (!SUBJECTS.has(submission.subject)) errors.subject = 'invalid';
+  if (!submission.message) errors.message = 'required';
+  for (const [field, max] of Object.entries(limits)) {
+    if (submission[field].length > max) errors[field] = 'tooLong';
+  }
+  if (Number.isNaN(Date.parse(submission.createdAt))) errors.createdAt = 'invalid';
+
+  return Object.keys(errors).length > 0 ? { errors } : { submission };
+}
@@ -1,31 +1,39 @@
-import { BrowserRouter as Router, Routes, Route } from 'react-router-dom';
+import { Suspense } from 'react';
+import { Routes, Route, useLocation } from 'react-router-dom';
 import Navigation from './components/Navigation';
 import Footer from './components/Footer';
-import Home from './pages/Home';
-import Gallery from './pages/Gallery';
-import Workshops from './pages/Workshops';
-import Catering from './pages/Catering';
-import About from './pages/About';
-import Contact from './pages/Contact';
+import RouteErrorBoundary from './components/RouteErrorBoundary';
+import { routes } from './routes';
+import { useRouteTransitionTiming } from './vitals';
 
+const PageFallback = () => (
+  <div className="min-h-screen flex items-center justify-center" aria-busy="true">
+    <span className="text-4xl text-red-500 animate-pulse">鮨</span>
+  </div>
+);
+
+// The router is supplied by the entry point: BrowserRouter in main.tsx,
+// StaticRouter in entry-server.tsx when prerendering.
 function App() {
+  const { pathname } = useLocation();
+  useRouteTransitionTiming();
+
   return (
-    <Router>
-      <div className="flex flex-col min-h-screen">
-        <Navigation />
-        <main className="flex-grow">
-          <Routes>
-            <Route path="/" element={<Home />} />
-            <Route path="/gallery" element={<Gallery />} />
-            <Route path="/workshops" element={<Workshops />} />
-            <Route path="/catering" element={<Catering />} />
-            <Route path="/about" element={<About />} />
-            <Route path="/contact" element={<Contact />} />
-          </Routes>
-        </main>
-        <Footer />
-      </div>
-    </Router>
+    <div className="flex flex-col min-h-screen">
+      <Navigation />
+      <main className="flex-grow">
+        <RouteErrorBoundary resetKey={pathname}>
+          <Suspense fallback={<PageFallback />}>
+            <Routes>
+              {routes.map(({ path, Component }) => (
+                <Route key={path} path={path} element={<Component />} />
+              ))}
+            </Routes>
+          </Suspense>
+        </RouteErrorBoundary>
+      </main>
+      <Footer />
+    </div>
   );
 }
 
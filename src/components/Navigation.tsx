@@ -1,14 +1,21 @@
 import { useState } from 'react';
 import { Link } from 'react-router-dom';
 import { useTranslation } from 'react-i18next';
+import { namespaceForPath, prefetchRoute } from '../routes';
 
 const Navigation = () => {
   const [isOpen, setIsOpen] = useState(false);
   const { t, i18n } = useTranslation();
 
+  const nextLanguage = i18n.language === 'fa' ? 'en' : 'fa';
+
   const toggleLanguage = () => {
-    const next = i18n.language === 'fa' ? 'en' : 'fa';
-    void i18n.changeLanguage(next);
+    void i18n.changeLanguage(nextLanguage);
+  };
+
+  // The other language is only downloaded once the user reaches for the toggle.
+  const prefetchLanguage = () => {
+    void i18n.loadLanguages(nextLanguage);
   };
 
   const navLinks = [
@@ -20,12 +27,25 @@ const Navigation = () => {
     { to: '/contact', label: t('nav.contact') },
   ];
 
+  // Warm the route chunk and its translations as soon as the user shows intent to navigate.
+  const prefetch = (to: string) => {
+    prefetchRoute(to);
+    const ns = namespaceForPath(to);
+    if (ns) void i18n.loadNamespaces(ns);
+  };
+
+  const prefetchProps = (to: string) => ({
+    onMouseEnter: () => prefetch(to),
+    onFocus: () => prefetch(to),
+    onTouchStart: () => prefetch(to),
+  });
+
   return (
     <nav className="bg-gray-900 text-white shadow-lg sticky top-0 z-50">
       <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
         <div className="flex justify-between items-center h-16">
           {/* Logo */}
-          <Link to="/" className="flex items-center gap-2">
+          <Link to="/" className="flex items-center gap-2" {...prefetchProps('/')}>
             <span className="text-2xl font-bold text-red-500">鮨</span>
             <span className="text-xl font-semibold">Ms. Maaedeh</span>
           </Link>
@@ -36,6 +56,7 @@ const Navigation = () => {
               <Link
                 key={link.to}
                 to={link.to}
+                {...prefetchProps(link.to)}
                 className="hover:text-red-500 transition-colors duration-200 font-medium"
               >
                 {link.label}
@@ -47,6 +68,9 @@ const Navigation = () => {
           <button
             type="button"
             onClick={toggleLanguage}
+            onMouseEnter={prefetchLanguage}
+            onFocus={prefetchLanguage}
+            onTouchStart={prefetchLanguage}
             className="hidden md:inline-flex items-center justify-center px-3 py-1.5 rounded-md border border-gray-700 text-sm font-medium hover:border-red-500 hover:text-red-500 transition-colors duration-200"
             aria-label={t('language.toggleLabel')}
           >
@@ -89,6 +113,9 @@ const Navigation = () => {
             <button
               type="button"
               onClick={toggleLanguage}
+              onMouseEnter={prefetchLanguage}
+              onFocus={prefetchLanguage}
+              onTouchStart={prefetchLanguage}
               className="w-full text-left py-2 hover:text-red-500 transition-colors duration-200"
               aria-label={t('language.toggleLabel')}
             >
@@ -98,6 +125,7 @@ const Navigation = () => {
               <Link
                 key={link.to}
                 to={link.to}
+                {...prefetchProps(link.to)}
                 onClick={() => setIsOpen(false)}
                 className="block py-2 hover:text-red-500 transition-colors duration-200"
               >
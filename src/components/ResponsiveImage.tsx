@@ -0,0 +1,40 @@
+interface ResponsiveImageProps {
+  image: ResponsiveImageData;
+  alt: string;
+  /** `sizes` attribute describing the rendered width at each breakpoint. */
+  sizes: string;
+  /** Above-the-fold images load eagerly with high fetch priority. */
+  priority?: boolean;
+  className?: string;
+}
+
+const ResponsiveImage = ({
+  image,
+  alt,
+  sizes,
+  priority = false,
+  className = '',
+}: ResponsiveImageProps) => {
+  const { src, width, height } = image;
+
+  return (
+    <picture>
+      {image.sources.map((source) => (
+        <source key={source.type} type={source.type} srcSet={source.srcSet} sizes={sizes} />
+      ))}
+      <img
+        src={src}
+        width={width}
+        height={height}
+        alt={alt}
+        loading={priority ? 'eager' : 'lazy'}
+        decoding="async"
+        fetchPriority={priority ? 'high' : 'auto'}
+        className={`bg-cover bg-center ${className}`}
+        style={{ backgroundImage: `url(${image.placeholder})` }}
+      />
+    </picture>
+  );
+};
+
+export default ResponsiveImage;
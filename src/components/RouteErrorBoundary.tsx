@@ -0,0 +1,56 @@
+import { Component, type ReactNode } from 'react';
+import { useTranslation } from 'react-i18next';
+import { resetFailedRoutes } from '../routes';
+
+interface RouteErrorBoundaryProps {
+  /** Changing it (e.g. on navigation) clears a previous error. */
+  resetKey: string;
+  children: ReactNode;
+}
+
+interface RouteErrorBoundaryState {
+  failed: boolean;
+}
+
+const RouteError = ({ onRetry }: { onRetry: () => void }) => {
+  const { t } = useTranslation();
+
+  return (
+    <div className="min-h-screen flex flex-col items-center justify-center gap-6 px-4 text-center" role="alert">
+      <span className="text-4xl text-red-500">鮨</span>
+      <p className="text-xl text-gray-700">{t('error.loadFailed')}</p>
+      <button
+        onClick={onRetry}
+        className="bg-red-600 text-white px-6 py-2 rounded-lg font-semibold hover:bg-red-700 transition-colors"
+      >
+        {t('error.retry')}
+      </button>
+    </div>
+  );
+};
+
+// A page chunk that fails to download (flaky mobile data, or a deploy that
+// removed it) would otherwise unmount the whole app. This keeps the navigation
+// and footer up and lets the visitor retry just the page.
+class RouteErrorBoundary extends Component<RouteErrorBoundaryProps, RouteErrorBoundaryState> {
+  state: RouteErrorBoundaryState = { failed: false };
+
+  static getDerivedStateFromError(): RouteErrorBoundaryState {
+    return { failed: true };
+  }
+
+  componentDidUpdate(previous: RouteErrorBoundaryProps) {
+    if (this.state.failed && previous.resetKey !== this.props.resetKey) this.retry();
+  }
+
+  retry = () => {
+    resetFailedRoutes();
+    this.setState({ failed: false });
+  };
+
+  render() {
+    return this.state.failed ? <RouteError onRetry={this.retry} /> : this.props.children;
+  }
+}
+
+export default RouteErrorBoundary;
@@ -0,0 +1,115 @@
+export interface ContactSubmission {
+  id: string;
+  name: string;
+  email: string;
+  phone: string;
+  subject: string;
+  message: string;
+  createdAt: string;
+}
+
+/** `sent`: accepted by the API. `queued`: saved offline, retried later. `failed`: refused or could not be saved. */
+export type DeliveryResult = 'sent' | 'queued' | 'failed';
+
+const ENDPOINT = '/api/contact';
+const DB_NAME = 'msmaaedeh';
+const STORE = 'contact-outbox';
+const MAX_RETRY_DELAY_MS = 5 * 60 * 1000;
+
+let db: Promise<IDBDatabase> | undefined;
+
+function openDb() {
+  db ??= new Promise<IDBDatabase>((resolve, reject) => {
+    const request = indexedDB.open(DB_NAME, 1);
+    request.onupgradeneeded = () => request.result.createObjectStore(STORE, { keyPath: 'id' });
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+  return db;
+}
+
+async function withStore<T>(mode: IDBTransactionMode, run: (store: IDBObjectStore) => IDBRequest<T>) {
+  const database = await openDb();
+  return new Promise<T>((resolve, reject) => {
+    const request = run(database.transaction(STORE, mode).objectStore(STORE));
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+async function post(submission: ContactSubmission): Promise<DeliveryResult> {
+  try {
+    const response = await fetch(ENDPOINT, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(submission),
+      keepalive: true,
+    });
+    if (response.ok) return 'sent';
+    return response.status >= 400 && response.status < 500 && response.status !== 429 ? 'failed' : 'queued';
+  } catch {
+    return 'queued';
+  }
+}
+
+let flushing: Promise<void> | undefined;
+let retryTimer: ReturnType<typeof setTimeout> | undefined;
+let retryDelay = 2000;
+
+function scheduleRetry() {
+  clearTimeout(retryTimer);
+  retryTimer = setTimeout(() => void flushOutbox(), retryDelay);
+  retryDelay = Math.min(retryDelay * 2, MAX_RETRY_DELAY_MS);
+}
+
+/** Re-sends everything still in the outbox, oldest first; one flush at a time. */
+export function flushOutbox() {
+  flushing ??= (async () => {
+    try {
+      const pending = await withStore<ContactSubmission[]>('readonly', (store) => store.getAll());
+      pending.sort((a, b) => a.createdAt.localeCompare(b.createdAt));
+      for (const submission of pending) {
+        const result = await post(submission);
+        if (result === 'queued') {
+          scheduleRetry();
+          return;
+        }
+        await withStore('readwrite', (store) => store.delete(submission.id));
+      }
+      retryDelay = 2000;
+    } catch {
+      // IndexedDB unavailable (private mode, old browser); nothing to flush
+    } finally {
+      flushing = undefined;
+    }
+  })();
+  return flushing;
+}
+
+/**
+ * Stores the submission in IndexedDB before the first send attempt, so a
+ * closed tab or a dropped connection never loses it; failed sends are retried
+ * with backoff and whenever the browser comes back online.
+ */
+export async function submitContact(submission: ContactSubmission): Promise<DeliveryResult> {
+  let stored = true;
+  try {
+    await withStore('readwrite', (store) => store.put(submission));
+  } catch {
+    stored = false;
+  }
+
+  const result = await post(submission);
+  if (result === 'queued' && stored) {
+    scheduleRetry();
+    return 'queued';
+  }
+  if (stored) await withStore('readwrite', (store) => store.delete(submission.id)).catch(() => undefined);
+  return result === 'queued' ? 'failed' : result;
+}
+
+/** Flushes leftovers from earlier visits and retries whenever the browser reconnects. */
+export function startContactOutbox() {
+  window.addEventListener('online', () => void flushOutbox());
+  void flushOutbox();
+}
@@ -0,0 +1,95 @@
+import hashtagCategories from './hashtag-categories.json';
+
+export const galleryCategories = ['nigiri', 'maki', 'sashimi', 'special'] as const;
+
+export type GalleryCategory = (typeof galleryCategories)[number];
+
+export interface GalleryItem {
+  /** Imported posts use their Instagram media id, which is also the dedupe key. */
+  id: string;
+  /** Hashtags without `#`, lower-cased. */
+  tags: string[];
+  /** Key in the `gallery` namespace; imported posts carry a caption in `title` instead. */
+  titleKey?: string;
+  title?: string;
+  emoji?: string;
+  /**
+   * The shards name a photo in src/assets/images/gallery/; the build
+   * (plugins/responsiveImages.ts) swaps the name for its processed variants.
+   */
+  image?: ResponsiveImageData;
+  /** When the post was published on Instagram (ISO 8601); absent on hand-written items. */
+  date?: string;
+}
+
+export interface IndexedGalleryItem extends GalleryItem {
+  categories: GalleryCategory[];
+}
+
+const categoryForTag = hashtagCategories as Record<string, GalleryCategory>;
+
+// Categories come from the hashtag mapping in MAEDEH_DATA_MIGRATION.md.
+function withCategories(items: GalleryItem[]): IndexedGalleryItem[] {
+  return items.map((item) => ({
+    ...item,
+    categories: [...new Set(item.tags.map((tag) => categoryForTag[tag]).filter(Boolean))],
+  }));
+}
+
+/** Posts per scroll step, and per `all-<n>.json` page (ALL_PAGE_SIZE in scripts/ingest-instagram.mjs). */
+export const galleryPageSize = 24;
+
+// Shards in src/data/gallery/, written by scripts/ingest-instagram.mjs:
+// - <category>.json holds every post tagged with that category, so a filter
+//   downloads only its own shard;
+// - all-<n>.json hold every post once, newest first, galleryPageSize per page,
+//   so "All" downloads only as far as the visitor scrolls.
+const shards = import.meta.glob<GalleryItem[]>('./gallery/*.json', { import: 'default' });
+
+const allPageCount = Object.keys(shards).filter((key) => /\/all-\d+\.json$/.test(key)).length;
+
+function loadShard(name: string) {
+  const load = shards[`./gallery/${name}.json`];
+  return load ? load() : Promise.resolve([]);
+}
+
+export interface GallerySlice {
+  items: IndexedGalleryItem[];
+  /** False while `all` still has pages to download. */
+  complete: boolean;
+}
+
+const loaded = new Map<string, Promise<GallerySlice>>();
+
+// Once per session; a failed download is forgotten so the next call retries it.
+function remember(key: string, load: () => Promise<GallerySlice>) {
+  let slice = loaded.get(key);
+  if (!slice) {
+    slice = load();
+    slice.catch(() => loaded.delete(key));
+    loaded.set(key, slice);
+  }
+  return slice;
+}
+
+function loadAllPages(count: number): Promise<GallerySlice> {
+  return remember(`all:${count}`, async () => {
+    const [previous, page] = await Promise.all([
+      count > 1 ? loadAllPages(count - 1) : undefined,
+      loadShard(`all-${count - 1}`),
+    ]);
+    return {
+      items: [...(previous?.items ?? []), ...withCategories(page)],
+      complete: count >= allPageCount,
+    };
+  });
+}
+
+/**
+ * Loads the items behind one filter: a category fetches its whole shard,
+ * `all` fetches its first `pages` pages (each only once).
+ */
+export function loadGallery(category: GalleryCategory | 'all', pages = 1) {
+  if (category === 'all') return loadAllPages(Math.max(1, Math.min(pages, allPageCount)));
+  return remember(category, async () => ({ items: withCategories(await loadShard(category)), complete: true }));
+}
@@ -0,0 +1,51 @@
+import { StrictMode } from 'react';
+import { prerender } from 'react-dom/static';
+import { StaticRouter } from 'react-router-dom';
+import { createInstance, type Resource, type ResourceKey } from 'i18next';
+import { I18nextProvider, initReactI18next } from 'react-i18next';
+import App from './App';
+import { basenameFor, type Language } from './locale';
+import { routes } from './routes';
+
+// The prerenderer has every translation on disk, so it loads them eagerly
+// instead of going through the lazy client backend in i18n.ts.
+const bundles = import.meta.glob<ResourceKey>('./locales/*/*.json', { eager: true, import: 'default' });
+
+const resources: Resource = {};
+for (const [file, data] of Object.entries(bundles)) {
+  const [, lng, ns] = /\.\/locales\/([^/]+)\/([^/]+)\.json$/.exec(file)!;
+  resources[lng] ??= {};
+  resources[lng][ns] = data;
+}
+
+export const pages = routes.map(({ path, ns }) => ({ path, ns }));
+
+export { languages, isRtl } from './locale';
+
+/**
+ * Renders one route in one language to static markup for `#root`. Resolves
+ * only after every lazy page and data chunk under a Suspense boundary has
+ * loaded, so the HTML is complete.
+ */
+export async function render(path: string, lng: Language) {
+  const i18n = createInstance();
+  await i18n.use(initReactI18next).init({
+    lng,
+    resources,
+    fallbackLng: false,
+    defaultNS: 'common',
+    interpolation: { escapeValue: false },
+  });
+
+  const basename = basenameFor(lng);
+  const { prelude } = await prerender(
+    <StrictMode>
+      <I18nextProvider i18n={i18n}>
+        <StaticRouter basename={basename || undefined} location={`${basename}${path}`}>
+          <App />
+        </StaticRouter>
+      </I18nextProvider>
+    </StrictMode>,
+  );
+  return new Response(prelude).text();
+}
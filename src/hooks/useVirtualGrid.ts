@@ -0,0 +1,88 @@
+import { useCallback, useEffect, useRef, useState, useSyncExternalStore } from 'react';
+
+// Mirrors the `grid-cols-1 sm:grid-cols-2 lg:grid-cols-3` breakpoints.
+function columnsForWidth(width: number) {
+  if (width >= 1024) return 3;
+  if (width >= 640) return 2;
+  return 1;
+}
+
+function subscribeResize(onChange: () => void) {
+  window.addEventListener('resize', onChange);
+  return () => window.removeEventListener('resize', onChange);
+}
+
+interface VirtualGridOptions {
+  /** Rows mounted above and below the viewport. */
+  overscan?: number;
+  /** Row height (card + gap) used until the first card has been measured. */
+  estimatedRowHeight?: number;
+}
+
+/**
+ * Windowed rendering for a uniform, window-scrolled grid: only the rows in and
+ * near the viewport are mounted, and the rest are replaced by padding so the
+ * scrollbar still reflects the full list.
+ */
+export function useVirtualGrid(count: number, { overscan = 2, estimatedRowHeight = 440 }: VirtualGridOptions = {}) {
+  const columns = useSyncExternalStore(
+    subscribeResize,
+    () => columnsForWidth(window.innerWidth),
+    () => 3,
+  );
+  const containerRef = useRef<HTMLDivElement>(null);
+  const [rowHeight, setRowHeight] = useState(estimatedRowHeight);
+  const [range, setRange] = useState({ start: 0, end: 1 + overscan * 2 });
+
+  const rowCount = Math.ceil(count / columns);
+
+  useEffect(() => {
+    let frame = 0;
+    const update = () => {
+      frame = 0;
+      const container = containerRef.current;
+      if (!container) return;
+      const top = container.getBoundingClientRect().top;
+      const start = Math.max(0, Math.floor(-top / rowHeight) - overscan);
+      const end = Math.max(start, Math.ceil((window.innerHeight - top) / rowHeight) + overscan);
+      setRange((prev) => (prev.start === start && prev.end === end ? prev : { start, end }));
+    };
+    const schedule = () => {
+      if (!frame) frame = requestAnimationFrame(update);
+    };
+
+    schedule();
+    window.addEventListener('scroll', schedule, { passive: true });
+    window.addEventListener('resize', schedule);
+    return () => {
+      cancelAnimationFrame(frame);
+      window.removeEventListener('scroll', schedule);
+      window.removeEventListener('resize', schedule);
+    };
+  }, [rowCount, rowHeight, overscan]);
+
+  // Attach to any rendered card; its height plus the grid's row gap is the row pitch.
+  const measureRef = useCallback((card: HTMLElement | null) => {
+    const grid = card?.parentElement;
+    if (!card || !grid) return;
+    const observer = new ResizeObserver(() => {
+      const gap = parseFloat(getComputedStyle(grid).rowGap) || 0;
+      setRowHeight(card.offsetHeight + gap);
+    });
+    observer.observe(card);
+    return () => observer.disconnect();
+  }, []);
+
+  const startRow = Math.min(range.start, rowCount);
+  const endRow = Math.min(range.end, rowCount);
+
+  return {
+    containerRef,
+    measureRef,
+    columns,
+    startIndex: startRow * columns,
+    endIndex: Math.min(count, endRow * columns),
+    paddingTop: startRow * rowHeight,
+    paddingBottom: (rowCount - endRow) * rowHeight,
+  };
+}
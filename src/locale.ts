@@ -0,0 +1,26 @@
+export const languages = ['en', 'fa'] as const;
+
+export type Language = (typeof languages)[number];
+
+// English pages live at the site root and Farsi pages under /fa/, so every
+// route can be prerendered once per language.
+const FA_PREFIX = '/fa';
+
+/** Language a URL is pinned to, or undefined for unprefixed (English/default) paths. */
+export function languageFromPath(pathname: string): Language | undefined {
+  return pathname === FA_PREFIX || pathname.startsWith(`${FA_PREFIX}/`) ? 'fa' : undefined;
+}
+
+/** Router basename for a language. */
+export function basenameFor(lng: Language) {
+  return lng === 'fa' ? FA_PREFIX : '';
+}
+
+/** Route path without its language prefix, e.g. `/fa/gallery` → `/gallery`. */
+export function stripLanguagePrefix(pathname: string) {
+  return languageFromPath(pathname) ? pathname.slice(FA_PREFIX.length) || '/' : pathname;
+}
+
+export function isRtl(lng: string) {
+  return lng === 'fa';
+}
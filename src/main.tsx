@@ -1,11 +1,56 @@
 import { StrictMode } from 'react'
-import { createRoot } from 'react-dom/client'
-import './i18n'
+import { createRoot, hydrateRoot, type Root } from 'react-dom/client'
+import { BrowserRouter } from 'react-router-dom'
+import i18n, { i18nReady } from './i18n'
+import { basenameFor, languageFromPath, stripLanguagePrefix } from './locale'
+import { registerServiceWorker } from './registerServiceWorker'
+import { routes } from './routes'
+import { initVitals } from './vitals'
 import './index.css'
 import App from './App.tsx'
 
-createRoot(document.getElementById('root')!).render(
+// Start observing before hydration so TTFB, LCP and early layout shifts are caught.
+initVitals(i18n)
+
+const { pathname } = window.location
+let basename = basenameFor(languageFromPath(pathname) ?? 'en')
+const route = routes.find((r) => r.path === stripLanguagePrefix(pathname))
+
+// Keyed by basename: switching language remounts the router under the new prefix.
+const app = (base: string) => (
   <StrictMode>
-    <App />
-  </StrictMode>,
+    <BrowserRouter key={base} basename={base}>
+      <App />
+    </BrowserRouter>
+  </StrictMode>
 )
+
+// Fetch the current page chunk in parallel with its translations, and only
+// hydrate once both are in so prerendered markup is adopted without a flash.
+void Promise.all([i18nReady, route?.preload().catch(() => undefined)]).then(() => {
+  const container = document.getElementById('root')!
+  let root: Root
+  if (container.hasChildNodes()) {
+    root = hydrateRoot(container, app(basename))
+  } else {
+    root = createRoot(container)
+    root.render(app(basename))
+  }
+
+  // Each language has its own URLs (/fa/... for Farsi), so the toggle moves the
+  // current page to the other language's URL; shared links and bookmarks then
+  // open the prerendered page in the language that was on screen.
+  i18n.on('languageChanged', (lng) => {
+    const next = basenameFor(lng === 'fa' ? 'fa' : 'en')
+    if (next === basename) return
+    const { search, hash } = window.location
+    history.replaceState(history.state, '', `${next}${stripLanguagePrefix(window.location.pathname)}${search}${hash}`)
+    basename = next
+    root.render(app(basename))
+  })
+})
+
+registerServiceWorker()
+
+// Deliver contact messages that were saved offline on an earlier visit.
+void import('./contactOutbox').then((outbox) => outbox.startContactOutbox())
@@ -1,7 +1,9 @@
 import { useTranslation } from 'react-i18next';
+import cateringImages from 'virtual:responsive-images/catering';
+import ResponsiveImage from '../components/ResponsiveImage';
 
 const Catering = () => {
-  const { t } = useTranslation();
+  const { t } = useTranslation('catering');
 
   const packages = [
     {
@@ -29,9 +31,9 @@ const Catering = () => {
       <div className="max-w-7xl mx-auto">
         {/* Header */}
         <div className="text-center mb-16">
-          <h1 className="text-5xl font-bold text-gray-900 mb-4">{t('catering.header.title')}</h1>
+          <h1 className="text-5xl font-bold text-gray-900 mb-4">{t('header.title')}</h1>
           <p className="text-xl text-gray-600 max-w-3xl mx-auto">
-            {t('catering.header.subtitle')}
+            {t('header.subtitle')}
           </p>
         </div>
 
@@ -43,11 +45,19 @@ const Catering = () => {
               className="bg-white rounded-lg shadow-lg overflow-hidden hover:shadow-xl transition-all transform hover:scale-105 animate-fade-in"
               style={{ animationDelay: `${index * 0.1}s` }}
             >
+              {cateringImages[pkg.key] && (
+                <ResponsiveImage
+                  image={cateringImages[pkg.key]}
+                  alt={t(`packages.${pkg.key}.name`)}
+                  sizes="(min-width: 768px) 33vw, 100vw"
+                  className="w-full aspect-[4/3] object-cover"
+                />
+              )}
               <div className="bg-gradient-to-br from-red-500 to-red-600 text-white p-8 text-center">
-                <span className="text-6xl block mb-4">{pkg.emoji}</span>
-                <h3 className="text-2xl font-bold mb-2">{t(`catering.packages.${pkg.key}.name`)}</h3>
-                <p className="text-red-100 mb-2">{t(`catering.packages.${pkg.key}.servings`)}</p>
-                <p className="text-2xl font-bold">{t(`catering.packages.${pkg.key}.price`)}</p>
+                {!cateringImages[pkg.key] && <span className="text-6xl block mb-4">{pkg.emoji}</span>}
+                <h3 className="text-2xl font-bold mb-2">{t(`packages.${pkg.key}.name`)}</h3>
+                <p className="text-red-100 mb-2">{t(`packages.${pkg.key}.servings`)}</p>
+                <p className="text-2xl font-bold">{t(`packages.${pkg.key}.price`)}</p>
               </div>
               <div className="p-6">
                 <ul className="space-y-3 mb-6">
@@ -64,12 +74,12 @@ const Catering = () => {
                           clipRule="evenodd"
                         />
                       </svg>
-                      <span className="text-gray-700">{t(`catering.packages.${pkg.key}.features.${featureKey}`)}</span>
+                      <span className="text-gray-700">{t(`packages.${pkg.key}.features.${featureKey}`)}</span>
                     </li>
                   ))}
                 </ul>
                 <button className="w-full bg-red-600 text-white py-3 rounded-lg font-semibold hover:bg-red-700 transition-colors">
-                  {t('catering.packages.requestQuote')}
+                  {t('packages.requestQuote')}
                 </button>
               </div>
             </div>
@@ -79,7 +89,7 @@ const Catering = () => {
         {/* Event Types */}
         <div className="bg-white rounded-lg shadow-lg p-8 mb-16">
           <h2 className="text-3xl font-bold text-gray-900 mb-8 text-center">
-            {t('catering.eventTypes.title')}
+            {t('eventTypes.title')}
           </h2>
           <div className="grid md:grid-cols-2 lg:grid-cols-4 gap-6">
             {[
@@ -90,8 +100,8 @@ const Catering = () => {
             ].map((event, idx) => (
               <div key={idx} className="text-center p-4">
                 <span className="text-5xl block mb-3">{event.icon}</span>
-                <h4 className="font-bold text-gray-900 mb-2">{t(`catering.eventTypes.items.${event.key}.title`)}</h4>
-                <p className="text-gray-600 text-sm">{t(`catering.eventTypes.items.${event.key}.desc`)}</p>
+                <h4 className="font-bold text-gray-900 mb-2">{t(`eventTypes.items.${event.key}.title`)}</h4>
+                <p className="text-gray-600 text-sm">{t(`eventTypes.items.${event.key}.desc`)}</p>
               </div>
             ))}
           </div>
@@ -100,7 +110,7 @@ const Catering = () => {
         {/* Process */}
         <div className="bg-white rounded-lg shadow-lg p-8 mb-16">
           <h2 className="text-3xl font-bold text-gray-900 mb-8 text-center">
-            {t('catering.process.title')}
+            {t('process.title')}
           </h2>
           <div className="grid md:grid-cols-4 gap-8">
             {[
@@ -113,8 +123,8 @@ const Catering = () => {
                 <div className="bg-red-600 text-white w-12 h-12 rounded-full flex items-center justify-center text-xl font-bold mx-auto mb-4">
                   {item.step}
                 </div>
-                <h4 className="font-bold text-gray-900 mb-2">{t(`catering.process.steps.${item.key}.title`)}</h4>
-                <p className="text-gray-600 text-sm">{t(`catering.process.steps.${item.key}.desc`)}</p>
+                <h4 className="font-bold text-gray-900 mb-2">{t(`process.steps.${item.key}.title`)}</h4>
+                <p className="text-gray-600 text-sm">{t(`process.steps.${item.key}.desc`)}</p>
               </div>
             ))}
           </div>
@@ -123,7 +133,7 @@ const Catering = () => {
         {/* Gallery Preview */}
         <div className="bg-white rounded-lg shadow-lg p-8 mb-16">
           <h2 className="text-3xl font-bold text-gray-900 mb-8 text-center">
-            {t('catering.pastEvents.title')}
+            {t('pastEvents.title')}
           </h2>
           <div className="grid grid-cols-2 md:grid-cols-4 gap-4">
             {[1, 2, 3, 4].map((item) => (
@@ -139,12 +149,12 @@ const Catering = () => {
 
         {/* CTA */}
         <div className="text-center bg-gradient-to-r from-red-500 to-red-600 text-white rounded-lg p-12">
-          <h2 className="text-3xl font-bold mb-4">{t('catering.cta.title')}</h2>
+          <h2 className="text-3xl font-bold mb-4">{t('cta.title')}</h2>
           <p className="text-xl mb-8">
-            {t('catering.cta.desc')}
+            {t('cta.desc')}
           </p>
           <button className="bg-white text-red-600 px-8 py-3 rounded-lg font-semibold hover:bg-gray-100 transition-colors">
-            {t('catering.cta.button')}
+            {t('cta.button')}
           </button>
         </div>
       </div>
@@ -1,27 +1,47 @@
 import { useState } from 'react';
 import { useTranslation } from 'react-i18next';
+import { submitContact, type ContactSubmission, type DeliveryResult } from '../contactOutbox';
+
+const fields = ['name', 'email', 'phone', 'subject', 'message'] as const;
+
+const statusStyles: Record<DeliveryResult, string> = {
+  sent: 'bg-green-50 text-green-800',
+  queued: 'bg-yellow-50 text-yellow-800',
+  failed: 'bg-red-50 text-red-800',
+};
 
 const Contact = () => {
-  const { t } = useTranslation();
-  const [formData, setFormData] = useState({
-    name: '',
-    email: '',
-    phone: '',
-    subject: '',
-    message: '',
-  });
-
-  const handleSubmit = (e: React.FormEvent) => {
+  const { t } = useTranslation('contact');
+  const [status, setStatus] = useState<DeliveryResult | null>(null);
+
+  // The form is uncontrolled: fields are read once on submit instead of
+  // copying the whole form into state on every keystroke.
+  const handleSubmit = (e: React.FormEvent<HTMLFormElement>) => {
     e.preventDefault();
-    // Placeholder for form submission logic
-    console.log('Form submitted:', formData);
-    alert(t('contact.form.successAlert'));
-  };
+    const form = e.currentTarget;
+    const data = new FormData(form);
+    const submission: ContactSubmission = {
+      id: crypto.randomUUID(),
+      name: '',
+      email: '',
+      phone: '',
+      subject: '',
+      message: '',
+      createdAt: new Date().toISOString(),
+    };
+    for (const field of fields) submission[field] = String(data.get(field) ?? '');
 
-  const handleChange = (e: React.ChangeEvent<HTMLInputElement | HTMLTextAreaElement | HTMLSelectElement>) => {
-    setFormData({
-      ...formData,
-      [e.target.name]: e.target.value,
+    // Optimistic: confirm straight away and let delivery continue in the background.
+    setStatus('sent');
+    form.reset();
+    void submitContact(submission).then((result) => {
+      setStatus(result);
+      if (result === 'failed') {
+        for (const field of fields) {
+          const input = form.elements.namedItem(field) as HTMLInputElement | HTMLTextAreaElement | HTMLSelectElement | null;
+          if (input) input.value = submission[field];
+        }
+      }
     });
   };
 
@@ -30,97 +50,92 @@ const Contact = () => {
       <div className="max-w-6xl mx-auto">
         {/* Header */}
         <div className="text-center mb-16">
-          <h1 className="text-5xl font-bold text-gray-900 mb-4">{t('contact.header.title')}</h1>
+          <h1 className="text-5xl font-bold text-gray-900 mb-4">{t('header.title')}</h1>
           <p className="text-xl text-gray-600">
-            {t('contact.header.subtitle')}
+            {t('header.subtitle')}
           </p>
         </div>
 
         <div className="grid md:grid-cols-2 gap-12">
           {/* Contact Form */}
           <div className="bg-white rounded-lg shadow-lg p-8">
-            <h2 className="text-2xl font-bold text-gray-900 mb-6">{t('contact.form.title')}</h2>
+            <h2 className="text-2xl font-bold text-gray-900 mb-6">{t('form.title')}</h2>
             <form onSubmit={handleSubmit} className="space-y-6">
+              {status && (
+                <p role="status" className={`rounded-lg px-4 py-3 text-sm ${statusStyles[status]}`}>
+                  {t(`form.status.${status}`)}
+                </p>
+              )}
               <div>
                 <label htmlFor="name" className="block text-sm font-medium text-gray-700 mb-2">
-                  {t('contact.form.fullName')} *
+                  {t('form.fullName')} *
                 </label>
                 <input
                   type="text"
                   id="name"
                   name="name"
                   required
-                  value={formData.name}
-                  onChange={handleChange}
                   className="w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-red-500 focus:border-transparent outline-none transition"
-                  placeholder={t('contact.form.fullNamePlaceholder')}
+                  placeholder={t('form.fullNamePlaceholder')}
                 />
               </div>
 
               <div>
                 <label htmlFor="email" className="block text-sm font-medium text-gray-700 mb-2">
-                  {t('contact.form.email')} *
+                  {t('form.email')} *
                 </label>
                 <input
                   type="email"
                   id="email"
                   name="email"
                   required
-                  value={formData.email}
-                  onChange={handleChange}
                   className="w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-red-500 focus:border-transparent outline-none transition"
-                  placeholder={t('contact.form.emailPlaceholder')}
+                  placeholder={t('form.emailPlaceholder')}
                 />
               </div>
 
               <div>
                 <label htmlFor="phone" className="block text-sm font-medium text-gray-700 mb-2">
-                  {t('contact.form.phone')}
+                  {t('form.phone')}
                 </label>
                 <input
                   type="tel"
                   id="phone"
                   name="phone"
-                  value={formData.phone}
-                  onChange={handleChange}
                   className="w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-red-500 focus:border-transparent outline-none transition"
-                  placeholder={t('contact.form.phonePlaceholder')}
+                  placeholder={t('form.phonePlaceholder')}
                 />
               </div>
 
               <div>
                 <label htmlFor="subject" className="block text-sm font-medium text-gray-700 mb-2">
-                  {t('contact.form.subject')} *
+                  {t('form.subject')} *
                 </label>
                 <select
                   id="subject"
                   name="subject"
                   required
-                  value={formData.subject}
-                  onChange={handleChange}
                   className="w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-red-500 focus:border-transparent outline-none transition"
                 >
-                  <option value="">{t('contact.form.subjectPlaceholder')}</option>
-                  <option value="workshop">{t('contact.form.subjectOptions.workshop')}</option>
-                  <option value="catering">{t('contact.form.subjectOptions.catering')}</option>
-                  <option value="general">{t('contact.form.subjectOptions.general')}</option>
-                  <option value="other">{t('contact.form.subjectOptions.other')}</option>
+                  <option value="">{t('form.subjectPlaceholder')}</option>
+                  <option value="workshop">{t('form.subjectOptions.workshop')}</option>
+                  <option value="catering">{t('form.subjectOptions.catering')}</option>
+                  <option value="general">{t('form.subjectOptions.general')}</option>
+                  <option value="other">{t('form.subjectOptions.other')}</option>
                 </select>
               </div>
 
               <div>
                 <label htmlFor="message" className="block text-sm font-medium text-gray-700 mb-2">
-                  {t('contact.form.message')} *
+                  {t('form.message')} *
                 </label>
                 <textarea
                   id="message"
                   name="message"
                   required
-                  value={formData.message}
-                  onChange={handleChange}
                   rows={5}
                   className="w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-red-500 focus:border-transparent outline-none transition resize-none"
-                  placeholder={t('contact.form.messagePlaceholder')}
+                  placeholder={t('form.messagePlaceholder')}
                 />
               </div>
 
@@ -128,7 +143,7 @@ const Contact = () => {
                 type="submit"
                 className="w-full bg-red-600 text-white py-3 rounded-lg font-semibold hover:bg-red-700 transition-colors"
               >
-                {t('contact.form.send')}
+                {t('form.send')}
               </button>
             </form>
           </div>
@@ -137,7 +152,7 @@ const Contact = () => {
           <div className="space-y-8">
             {/* Info Cards */}
             <div className="bg-white rounded-lg shadow-lg p-8">
-              <h2 className="text-2xl font-bold text-gray-900 mb-6">{t('contact.info.title')}</h2>
+              <h2 className="text-2xl font-bold text-gray-900 mb-6">{t('info.title')}</h2>
               <div className="space-y-6">
                 <div className="flex items-start">
                   <div className="bg-red-100 p-3 rounded-lg mr-4">
@@ -146,7 +161,7 @@ const Contact = () => {
                     </svg>
                   </div>
                   <div>
-                    <h3 className="font-semibold text-gray-900 mb-1">{t('contact.info.email')}</h3>
+                    <h3 className="font-semibold text-gray-900 mb-1">{t('info.email')}</h3>
                     <a href="mailto:hello@msmaaedeh.com" className="text-gray-600 hover:text-red-600 transition-colors">
                       hello@msmaaedeh.com
                     </a>
@@ -160,7 +175,7 @@ const Contact = () => {
                     </svg>
                   </div>
                   <div>
-                    <h3 className="font-semibold text-gray-900 mb-1">{t('contact.info.phone')}</h3>
+                    <h3 className="font-semibold text-gray-900 mb-1">{t('info.phone')}</h3>
                     <a href="tel:+15551234567" className="text-gray-600 hover:text-red-600 transition-colors">
                       (555) 123-4567
                     </a>
@@ -175,11 +190,11 @@ const Contact = () => {
                     </svg>
                   </div>
                   <div>
-                    <h3 className="font-semibold text-gray-900 mb-1">{t('contact.info.location')}</h3>
+                    <h3 className="font-semibold text-gray-900 mb-1">{t('info.location')}</h3>
                     <p className="text-gray-600">
-                      {t('contact.info.locationValue1')}
+                      {t('info.locationValue1')}
                       <br />
-                      {t('contact.info.locationValue2')}
+                      {t('info.locationValue2')}
                     </p>
                   </div>
                 </div>
@@ -188,28 +203,28 @@ const Contact = () => {
 
             {/* Hours */}
             <div className="bg-white rounded-lg shadow-lg p-8">
-              <h2 className="text-2xl font-bold text-gray-900 mb-6">{t('contact.availability.title')}</h2>
+              <h2 className="text-2xl font-bold text-gray-900 mb-6">{t('availability.title')}</h2>
               <div className="space-y-3">
                 <div className="flex justify-between">
-                  <span className="text-gray-600">{t('contact.availability.workshops')}</span>
-                  <span className="font-semibold text-gray-900">{t('contact.availability.workshopsValue')}</span>
+                  <span className="text-gray-600">{t('availability.workshops')}</span>
+                  <span className="font-semibold text-gray-900">{t('availability.workshopsValue')}</span>
                 </div>
                 <div className="flex justify-between">
-                  <span className="text-gray-600">{t('contact.availability.catering')}</span>
-                  <span className="font-semibold text-gray-900">{t('contact.availability.cateringValue')}</span>
+                  <span className="text-gray-600">{t('availability.catering')}</span>
+                  <span className="font-semibold text-gray-900">{t('availability.cateringValue')}</span>
                 </div>
                 <div className="flex justify-between">
-                  <span className="text-gray-600">{t('contact.availability.responseTime')}</span>
-                  <span className="font-semibold text-gray-900">{t('contact.availability.responseTimeValue')}</span>
+                  <span className="text-gray-600">{t('availability.responseTime')}</span>
+                  <span className="font-semibold text-gray-900">{t('availability.responseTimeValue')}</span>
                 </div>
               </div>
             </div>
 
             {/* Social */}
             <div className="bg-gradient-to-r from-red-500 to-red-600 text-white rounded-lg p-8">
-              <h2 className="text-2xl font-bold mb-4">{t('contact.social.title')}</h2>
+              <h2 className="text-2xl font-bold mb-4">{t('social.title')}</h2>
               <p className="mb-6 text-red-100">
-                {t('contact.social.desc')}
+                {t('social.desc')}
               </p>
               <div className="flex gap-4">
                 <a
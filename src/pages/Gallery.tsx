@@ -1,38 +1,112 @@
-import { useState } from 'react';
+import { memo, use, useEffect, useRef, useState, useTransition, type Ref } from 'react';
 import { useTranslation } from 'react-i18next';
+import ResponsiveImage from '../components/ResponsiveImage';
+import {
+  galleryCategories,
+  galleryPageSize,
+  loadGallery,
+  type GalleryCategory,
+  type IndexedGalleryItem,
+} from '../data/gallery';
+import { useVirtualGrid } from '../hooks/useVirtualGrid';
+
+const categories = ['all', ...galleryCategories] as const;
+
+interface GalleryCardProps {
+  item: IndexedGalleryItem;
+  /** Stagger within a row only, so delays stay bounded however long the list gets. */
+  delay: number;
+  cardRef?: Ref<HTMLDivElement>;
+}
+
+const GalleryCard = memo(({ item, delay, cardRef }: GalleryCardProps) => {
+  const { t } = useTranslation('gallery');
+  const title = item.titleKey ? t(item.titleKey) : (item.title ?? '');
+
+  return (
+    <div
+      ref={cardRef}
+      className="group relative bg-white rounded-lg shadow-lg overflow-hidden transition-transform transform hover:scale-105 animate-fade-in"
+      style={{ animationDelay: `${delay}s` }}
+    >
+      {item.image ? (
+        <ResponsiveImage
+          image={item.image}
+          alt={title}
+          sizes="(min-width: 1024px) 33vw, (min-width: 640px) 50vw, 100vw"
+          className="w-full aspect-square object-cover"
+        />
+      ) : (
+        <div className="aspect-square bg-gradient-to-br from-gray-200 to-gray-300 flex items-center justify-center">
+          <span className="text-8xl group-hover:scale-110 transition-transform">
+            {item.emoji}
+          </span>
+        </div>
+      )}
+      <div className="p-6">
+        <h3 className="text-xl font-bold text-gray-900 mb-2 truncate">{title}</h3>
+        <p className="text-gray-600 text-sm uppercase tracking-wide">
+          {item.categories.length > 0 && t(`categories.${item.categories[0]}`)}
+        </p>
+      </div>
+      {/* Overlay on hover */}
+      <div className="absolute inset-0 bg-red-600 bg-opacity-0 group-hover:bg-opacity-90 transition-all flex items-center justify-center opacity-0 group-hover:opacity-100">
+        <button className="bg-white text-red-600 px-6 py-2 rounded-lg font-semibold">
+          {t('viewDetails')}
+        </button>
+      </div>
+    </div>
+  );
+});
 
 const Gallery = () => {
-  const { t } = useTranslation();
-  const [selectedCategory, setSelectedCategory] = useState('all');
+  const { t } = useTranslation('gallery');
+  const [selectedCategory, setSelectedCategory] = useState<GalleryCategory | 'all'>('all');
+  const [pages, setPages] = useState(1);
+  const [, startTransition] = useTransition();
 
-  const categories = ['all', 'nigiri', 'maki', 'sashimi', 'special'];
+  const { items: filteredItems, complete } = use(loadGallery(selectedCategory, pages));
+  const loadedCount = Math.min(filteredItems.length, pages * galleryPageSize);
+  const { containerRef, measureRef, columns, startIndex, endIndex, paddingTop, paddingBottom } =
+    useVirtualGrid(loadedCount);
 
-  // Placeholder gallery items
-  const galleryItems = [
-    { id: 1, category: 'nigiri', titleKey: 'gallery.items.tunaNigiri', emoji: '🍣' },
-    { id: 2, category: 'maki', titleKey: 'gallery.items.dragonRoll', emoji: '🍙' },
-    { id: 3, category: 'sashimi', titleKey: 'gallery.items.salmonSashimi', emoji: '🐟' },
-    { id: 4, category: 'special', titleKey: 'gallery.items.rainbowPlatter', emoji: '🌈' },
-    { id: 5, category: 'nigiri', titleKey: 'gallery.items.salmonNigiri', emoji: '🍣' },
-    { id: 6, category: 'maki', titleKey: 'gallery.items.californiaRoll', emoji: '🍙' },
-    { id: 7, category: 'sashimi', titleKey: 'gallery.items.tunaSashimi', emoji: '🐟' },
-    { id: 8, category: 'special', titleKey: 'gallery.items.artisticCreation', emoji: '🎨' },
-    { id: 9, category: 'nigiri', titleKey: 'gallery.items.eelNigiri', emoji: '🍣' },
-  ];
+  // Infinite scroll: reveal the next page once the end of the grid comes near.
+  // Under "All" that page may still need downloading, hence the transition.
+  const sentinelRef = useRef<HTMLDivElement>(null);
+  const hasMore = loadedCount < filteredItems.length || !complete;
+  useEffect(() => {
+    const sentinel = sentinelRef.current;
+    if (!sentinel || !hasMore) return;
+    const observer = new IntersectionObserver(
+      (entries) => {
+        if (entries.some((entry) => entry.isIntersecting)) startTransition(() => setPages((p) => p + 1));
+      },
+      { rootMargin: '800px 0px' },
+    );
+    observer.observe(sentinel);
+    return () => observer.disconnect();
+  }, [hasMore, loadedCount]);
 
-  const filteredItems =
-    selectedCategory === 'all'
-      ? galleryItems
-      : galleryItems.filter((item) => item.category === selectedCategory);
+  // A transition keeps the current grid on screen while a shard downloads.
+  const selectCategory = (category: GalleryCategory | 'all') => {
+    startTransition(() => {
+      setSelectedCategory(category);
+      setPages(1);
+    });
+  };
+
+  const prefetchCategory = (category: GalleryCategory | 'all') => {
+    void loadGallery(category).catch(() => undefined);
+  };
 
   return (
     <div className="min-h-screen bg-gray-50 py-16 px-4 animate-fade-in">
       <div className="max-w-7xl mx-auto">
         {/* Header */}
         <div className="text-center mb-12">
-          <h1 className="text-5xl font-bold text-gray-900 mb-4">{t('gallery.header.title')}</h1>
+          <h1 className="text-5xl font-bold text-gray-900 mb-4">{t('header.title')}</h1>
           <p className="text-xl text-gray-600">
-            {t('gallery.header.subtitle')}
+            {t('header.subtitle')}
           </p>
         </div>
 
@@ -41,58 +115,49 @@ const Gallery = () => {
           {categories.map((category) => (
             <button
               key={category}
-              onClick={() => setSelectedCategory(category)}
+              data-category={category}
+              aria-pressed={selectedCategory === category}
+              onClick={() => selectCategory(category)}
+              onMouseEnter={() => prefetchCategory(category)}
+              onFocus={() => prefetchCategory(category)}
+              onTouchStart={() => prefetchCategory(category)}
               className={`px-6 py-2 rounded-full font-semibold transition-all ${
                 selectedCategory === category
                   ? 'bg-red-600 text-white shadow-lg'
                   : 'bg-white text-gray-700 hover:bg-gray-100'
               }`}
             >
-              {t(`gallery.categories.${category}`)}
+              {t(`categories.${category}`)}
             </button>
           ))}
         </div>
 
         {/* Gallery Grid */}
-        <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 gap-8">
-          {filteredItems.map((item, index) => (
-            <div
-              key={item.id}
-              className="group relative bg-white rounded-lg shadow-lg overflow-hidden transition-transform transform hover:scale-105 animate-fade-in"
-              style={{ animationDelay: `${index * 0.1}s` }}
-            >
-              <div className="aspect-square bg-gradient-to-br from-gray-200 to-gray-300 flex items-center justify-center">
-                <span className="text-8xl group-hover:scale-110 transition-transform">
-                  {item.emoji}
-                </span>
-              </div>
-              <div className="p-6">
-                <h3 className="text-xl font-bold text-gray-900 mb-2">{t(item.titleKey)}</h3>
-                <p className="text-gray-600 text-sm uppercase tracking-wide">
-                  {t(`gallery.categories.${item.category}`)}
-                </p>
-              </div>
-              {/* Overlay on hover */}
-              <div className="absolute inset-0 bg-red-600 bg-opacity-0 group-hover:bg-opacity-90 transition-all flex items-center justify-center opacity-0 group-hover:opacity-100">
-                <button className="bg-white text-red-600 px-6 py-2 rounded-lg font-semibold">
-                  {t('gallery.viewDetails')}
-                </button>
-              </div>
-            </div>
-          ))}
+        <div ref={containerRef} style={{ paddingTop, paddingBottom }}>
+          <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 gap-8">
+            {filteredItems.slice(startIndex, endIndex).map((item, offset) => (
+              <GalleryCard
+                key={item.id}
+                item={item}
+                delay={((startIndex + offset) % columns) * 0.1}
+                cardRef={offset === 0 ? measureRef : undefined}
+              />
+            ))}
+          </div>
         </div>
+        <div ref={sentinelRef} aria-hidden="true" />
 
         {/* Carousel Section */}
         <div className="mt-20">
           <h2 className="text-3xl font-bold text-center mb-8 text-gray-900">
-            {t('gallery.featured.title')}
+            {t('featured.title')}
           </h2>
           <div className="relative bg-white rounded-lg shadow-xl p-8">
             <div className="flex items-center justify-center h-96">
               <div className="text-center">
                 <span className="text-9xl block mb-4">🍱</span>
                 <p className="text-gray-500 text-lg">
-                  {t('gallery.featured.placeholder')}
+                  {t('featured.placeholder')}
                 </p>
               </div>
             </div>
@@ -1,33 +1,44 @@
 import { Link } from 'react-router-dom';
 import { useTranslation } from 'react-i18next';
+import homeImages from 'virtual:responsive-images/home';
+import ResponsiveImage from '../components/ResponsiveImage';
 
 const Home = () => {
-  const { t } = useTranslation();
+  const { t } = useTranslation('home');
 
   return (
     <div className="animate-fade-in">
       {/* Hero Section */}
       <section className="relative h-screen flex items-center justify-center bg-gradient-to-br from-gray-900 via-gray-800 to-red-900 text-white">
+        {homeImages.hero && (
+          <ResponsiveImage
+            image={homeImages.hero}
+            alt=""
+            sizes="100vw"
+            priority
+            className="absolute inset-0 w-full h-full object-cover"
+          />
+        )}
         <div className="absolute inset-0 bg-black opacity-40"></div>
         <div className="relative z-10 text-center px-4">
           <h1 className="text-6xl md:text-8xl font-bold mb-6 animate-fade-in">
             <span className="text-red-500">鮨</span> Ms. Maaedeh
           </h1>
           <p className="text-xl md:text-2xl mb-8 text-gray-200">
-            {t('home.hero.tagline')}
+            {t('hero.tagline')}
           </p>
           <div className="flex flex-col sm:flex-row gap-4 justify-center">
             <Link
               to="/gallery"
               className="bg-red-600 hover:bg-red-700 text-white px-8 py-3 rounded-lg font-semibold transition-all transform hover:scale-105"
             >
-              {t('home.hero.exploreGallery')}
+              {t('hero.exploreGallery')}
             </Link>
             <Link
               to="/contact"
               className="bg-transparent border-2 border-white hover:bg-white hover:text-gray-900 text-white px-8 py-3 rounded-lg font-semibold transition-all"
             >
-              {t('home.hero.getInTouch')}
+              {t('hero.getInTouch')}
             </Link>
           </div>
         </div>
@@ -39,31 +50,40 @@ const Home = () => {
           <div className="grid md:grid-cols-2 gap-12 items-center">
             <div>
               <h2 className="text-4xl font-bold mb-6 text-gray-900">
-                {t('home.aboutPreview.title')}
+                {t('aboutPreview.title')}
               </h2>
               <p className="text-gray-600 mb-4 leading-relaxed">
-                {t('home.aboutPreview.p1')}
+                {t('aboutPreview.p1')}
               </p>
               <p className="text-gray-600 mb-6 leading-relaxed">
-                {t('home.aboutPreview.p2')}
+                {t('aboutPreview.p2')}
               </p>
               <Link
                 to="/about"
                 className="text-red-600 hover:text-red-700 font-semibold inline-flex items-center"
               >
-                {t('home.aboutPreview.learnMore')}
+                {t('aboutPreview.learnMore')}
                 <svg className="w-5 h-5 ml-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                   <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M9 5l7 7-7 7" />
                 </svg>
               </Link>
             </div>
-            <div className="bg-gray-200 h-96 rounded-lg flex items-center justify-center">
-              <p className="text-gray-500 text-center">
-                {t('home.aboutPreview.placeholder')}
-                <br />
-                <span className="text-4xl mt-4 block">🍣</span>
-              </p>
-            </div>
+            {homeImages.about ? (
+              <ResponsiveImage
+                image={homeImages.about}
+                alt={t('aboutPreview.title')}
+                sizes="(min-width: 768px) 50vw, 100vw"
+                className="w-full h-96 object-cover rounded-lg"
+              />
+            ) : (
+              <div className="bg-gray-200 h-96 rounded-lg flex items-center justify-center">
+                <p className="text-gray-500 text-center">
+                  {t('aboutPreview.placeholder')}
+                  <br />
+                  <span className="text-4xl mt-4 block">🍣</span>
+                </p>
+              </div>
+            )}
           </div>
         </div>
       </section>
@@ -72,7 +92,7 @@ const Home = () => {
       <section className="py-20 px-4 bg-gray-50">
         <div className="max-w-6xl mx-auto">
           <h2 className="text-4xl font-bold text-center mb-12 text-gray-900">
-            {t('home.services.title')}
+            {t('services.title')}
           </h2>
           <div className="grid md:grid-cols-3 gap-8">
             {/* Gallery */}
@@ -82,9 +102,9 @@ const Home = () => {
                   <span className="text-6xl">🎨</span>
                 </div>
                 <div className="p-6">
-                  <h3 className="text-2xl font-bold mb-2 text-gray-900">{t('home.services.gallery.title')}</h3>
+                  <h3 className="text-2xl font-bold mb-2 text-gray-900">{t('services.gallery.title')}</h3>
                   <p className="text-gray-600">
-                    {t('home.services.gallery.desc')}
+                    {t('services.gallery.desc')}
                   </p>
                 </div>
               </div>
@@ -97,9 +117,9 @@ const Home = () => {
                   <span className="text-6xl">👨‍🍳</span>
                 </div>
                 <div className="p-6">
-                  <h3 className="text-2xl font-bold mb-2 text-gray-900">{t('home.services.workshops.title')}</h3>
+                  <h3 className="text-2xl font-bold mb-2 text-gray-900">{t('services.workshops.title')}</h3>
                   <p className="text-gray-600">
-                    {t('home.services.workshops.desc')}
+                    {t('services.workshops.desc')}
                   </p>
                 </div>
               </div>
@@ -112,9 +132,9 @@ const Home = () => {
                   <span className="text-6xl">🍱</span>
                 </div>
                 <div className="p-6">
-                  <h3 className="text-2xl font-bold mb-2 text-gray-900">{t('home.services.catering.title')}</h3>
+                  <h3 className="text-2xl font-bold mb-2 text-gray-900">{t('services.catering.title')}</h3>
                   <p className="text-gray-600">
-                    {t('home.services.catering.desc')}
+                    {t('services.catering.desc')}
                   </p>
                 </div>
               </div>
@@ -126,15 +146,15 @@ const Home = () => {
       {/* CTA Section */}
       <section className="py-20 px-4 bg-red-600 text-white">
         <div className="max-w-4xl mx-auto text-center">
-          <h2 className="text-4xl font-bold mb-6">{t('home.cta.title')}</h2>
+          <h2 className="text-4xl font-bold mb-6">{t('cta.title')}</h2>
           <p className="text-xl mb-8">
-            {t('home.cta.desc')}
+            {t('cta.desc')}
           </p>
           <Link
             to="/contact"
             className="inline-block bg-white text-red-600 px-8 py-3 rounded-lg font-semibold hover:bg-gray-100 transition-all transform hover:scale-105"
           >
-            {t('home.cta.contactUs')}
+            {t('cta.contactUs')}
           </Link>
         </div>
       </section>
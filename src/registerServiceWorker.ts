@@ -0,0 +1,27 @@
+/**
+ * Registers dist/sw.js (see scripts/sw-template.js) in production builds.
+ *
+ * A new deploy's worker waits while pages run the old one. Once this tab is
+ * hidden it asks the worker to take over, which the worker only does if this
+ * is the only open page, so no other tab loses the chunks it booted with.
+ * This tab keeps running the old build; the previous precache is kept for it,
+ * and the next full load runs entirely on the new deploy.
+ */
+export function registerServiceWorker() {
+  if (!import.meta.env.PROD || !('serviceWorker' in navigator)) return;
+
+  window.addEventListener('load', () => {
+    navigator.serviceWorker.register('/sw.js').then(
+      (registration) => {
+        document.addEventListener('visibilitychange', () => {
+          if (document.visibilityState === 'hidden' && registration.waiting) {
+            registration.waiting.postMessage('SKIP_WAITING');
+          }
+        });
+      },
+      () => {
+        // ignore; the site works without offline support
+      },
+    );
+  });
+}
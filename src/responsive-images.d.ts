@@ -0,0 +1,15 @@
+/** One processed photo, as generated by plugins/responsiveImages.ts. */
+interface ResponsiveImageData {
+  src: string;
+  width: number;
+  height: number;
+  /** Tiny inline WebP shown while the real image loads. */
+  placeholder: string;
+  sources: { type: 'image/avif' | 'image/webp'; srcSet: string }[];
+}
+
+declare module 'virtual:responsive-images/*' {
+  /** Photos in `src/assets/images/<folder>/`, keyed by file name without extension. */
+  const images: Record<string, ResponsiveImageData>;
+  export default images;
+}
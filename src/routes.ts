@@ -0,0 +1,69 @@
+import { lazy, type ComponentType, type LazyExoticComponent } from 'react';
+
+type PageModule = { default: ComponentType };
+
+export interface PageRoute {
+  path: string;
+  /** Translation namespace (`src/locales/<lng>/<ns>.json`) the page reads from. */
+  ns: string;
+  Component: LazyExoticComponent<ComponentType>;
+  preload: () => Promise<PageModule>;
+  /** Rebuilds `Component` if its chunk failed to load, so rendering it fetches again. */
+  reset: () => void;
+}
+
+// Each page gets its own chunk. `preload` memoizes the dynamic import so the
+// same promise backs both prefetch-on-intent and the lazy component. A failed
+// fetch (e.g. flaky network) is forgotten, so the next `preload` retries it.
+// A lazy() component caches its rejection for good, though, so once one has
+// failed it must be replaced via `reset` before it can render again.
+function page(path: string, ns: string, load: () => Promise<PageModule>): PageRoute {
+  let pending: Promise<PageModule> | undefined;
+  let failed = false;
+  const preload = () => {
+    pending ??= load().catch((error: unknown) => {
+      pending = undefined;
+      failed = true;
+      throw error;
+    });
+    return pending;
+  };
+  const route: PageRoute = {
+    path,
+    ns,
+    Component: lazy(preload),
+    preload,
+    reset() {
+      if (!failed) return;
+      failed = false;
+      route.Component = lazy(preload);
+    },
+  };
+  return route;
+}
+
+export const routes: PageRoute[] = [
+  page('/', 'home', () => import('./pages/Home')),
+  page('/gallery', 'gallery', () => import('./pages/Gallery')),
+  page('/workshops', 'workshops', () => import('./pages/Workshops')),
+  page('/catering', 'catering', () => import('./pages/Catering')),
+  page('/about', 'about', () => import('./pages/About')),
+  page('/contact', 'contact', () => import('./pages/Contact')),
+];
+
+export function prefetchRoute(path: string) {
+  const route = routes.find((r) => r.path === path);
+  if (!route) return;
+  route.preload().catch(() => {
+    // ignore; rendering the route reports the failure and offers a retry
+  });
+}
+
+/** Lets every route whose chunk failed to load try again on its next render. */
+export function resetFailedRoutes() {
+  routes.forEach((route) => route.reset());
+}
+
+export function namespaceForPath(path: string) {
+  return routes.find((r) => r.path === path)?.ns;
+}
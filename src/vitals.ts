@@ -0,0 +1,226 @@
+import { useEffect } from 'react';
+import { useLocation } from 'react-router-dom';
+import type { i18n as I18n } from 'i18next';
+import { stripLanguagePrefix } from './locale';
+
+export type MetricName = 'LCP' | 'INP' | 'CLS' | 'TTFB' | 'route-transition' | 'language-switch';
+
+export interface MetricRecord {
+  name: MetricName;
+  value: number;
+  route: string;
+  lang: string;
+  session: string;
+  /** ms since navigation start. */
+  at: number;
+}
+
+const ENDPOINT = import.meta.env.VITE_METRICS_ENDPOINT ?? '/api/metrics';
+const BATCH_SIZE = 20;
+
+let session = '';
+const queue: MetricRecord[] = [];
+
+const currentRoute = () => stripLanguagePrefix(window.location.pathname);
+const currentLang = () => document.documentElement.lang || 'en';
+
+function record(name: MetricName, value: number, route = currentRoute(), lang = currentLang()) {
+  const rounded = name === 'CLS' ? Number(value.toFixed(4)) : Math.round(value);
+  queue.push({ name, value: rounded, route, lang, session, at: Math.round(performance.now()) });
+  if (queue.length >= BATCH_SIZE) flush();
+}
+
+function flush() {
+  if (queue.length === 0) return;
+  const body = JSON.stringify(queue.splice(0));
+  const sent = navigator.sendBeacon?.(ENDPOINT, new Blob([body], { type: 'application/json' }));
+  if (!sent) {
+    void fetch(ENDPOINT, { method: 'POST', body, keepalive: true, headers: { 'Content-Type': 'application/json' } }).catch(
+      () => undefined,
+    );
+  }
+}
+
+// Resolves after the next frame has been painted.
+function afterNextPaint() {
+  return new Promise<void>((resolve) => requestAnimationFrame(() => setTimeout(resolve, 0)));
+}
+
+function observe(type: string, callback: (entries: PerformanceEntryList) => void, options: object = {}) {
+  try {
+    new PerformanceObserver((list) => callback(list.getEntries())).observe({ type, buffered: true, ...options });
+  } catch {
+    // entry type not supported by this browser
+  }
+}
+
+/**
+ * Per route+language accumulators, reported when the page is hidden. Created
+ * for every route and language shown, so views without a shift report CLS 0.
+ */
+const pageMetrics = new Map<string, { route: string; lang: string; cls: number; interactions: number[] }>();
+
+function pageMetricsFor(route = currentRoute(), lang = currentLang()) {
+  const key = `${route}|${lang}`;
+  let entry = pageMetrics.get(key);
+  if (!entry) {
+    entry = { route, lang, cls: 0, interactions: [] };
+    pageMetrics.set(key, entry);
+  }
+  return entry;
+}
+
+function observeCls() {
+  // Session windows: shifts less than 1s apart and within 5s are summed; CLS is the worst window.
+  let windowValue = 0;
+  let windowStart = 0;
+  let lastShift = 0;
+  let windowKey = '';
+
+  observe('layout-shift', (entries) => {
+    for (const entry of entries as (PerformanceEntry & { value: number; hadRecentInput: boolean })[]) {
+      if (entry.hadRecentInput) continue;
+      const page = pageMetricsFor();
+      const key = `${page.route}|${page.lang}`;
+      if (key !== windowKey || entry.startTime - lastShift > 1000 || entry.startTime - windowStart > 5000) {
+        windowValue = 0;
+        windowStart = entry.startTime;
+        windowKey = key;
+      }
+      windowValue += entry.value;
+      lastShift = entry.startTime;
+      page.cls = Math.max(page.cls, windowValue);
+    }
+  });
+}
+
+// Longest entry seen per interaction, with the bucket it was counted in.
+const interactionsById = new Map<number, { duration: number; interactions: number[] }>();
+
+function observeInp() {
+  observe(
+    'event',
+    (entries) => {
+      for (const entry of entries as (PerformanceEntry & { interactionId?: number })[]) {
+        if (!entry.interactionId) continue;
+        const previous = interactionsById.get(entry.interactionId);
+        if (previous && previous.duration >= entry.duration) continue;
+
+        // A later, longer entry replaces the earlier one in whichever bucket counted it.
+        if (previous) {
+          const index = previous.interactions.indexOf(previous.duration);
+          if (index !== -1) previous.interactions.splice(index, 1);
+        }
+        const { interactions } = pageMetricsFor();
+        interactions.push(entry.duration);
+        interactionsById.set(entry.interactionId, { duration: entry.duration, interactions });
+      }
+    },
+    { durationThreshold: 40 },
+  );
+}
+
+// INP is the worst interaction, ignoring one outlier per 50 interactions.
+function inpOf(interactions: number[]) {
+  const sorted = [...interactions].sort((a, b) => b - a);
+  return sorted[Math.min(sorted.length - 1, Math.floor(interactions.length / 50))];
+}
+
+function observeLcp() {
+  const route = currentRoute();
+  let lcp = 0;
+  let reported = false;
+  observe('largest-contentful-paint', (entries) => {
+    lcp = entries[entries.length - 1]?.startTime ?? lcp;
+  });
+  // LCP is final once the user interacts or leaves.
+  const report = () => {
+    if (reported || lcp === 0) return;
+    reported = true;
+    record('LCP', lcp, route);
+  };
+  for (const type of ['keydown', 'pointerdown']) addEventListener(type, report, { once: true, capture: true });
+  return report;
+}
+
+function reportTtfb() {
+  const [navigation] = performance.getEntriesByType('navigation') as PerformanceNavigationTiming[];
+  if (navigation) record('TTFB', navigation.responseStart);
+}
+
+let transitionStart: number | undefined;
+
+function trackNavigationIntent() {
+  const start = () => {
+    transitionStart = performance.now();
+  };
+  addEventListener(
+    'click',
+    (event) => {
+      const link = (event.target as Element | null)?.closest?.('a[href]');
+      if (link && (link as HTMLAnchorElement).origin === window.location.origin) start();
+    },
+    { capture: true },
+  );
+  addEventListener('popstate', start);
+}
+
+function trackLanguageSwitch(i18n: I18n) {
+  let started: number | undefined;
+  i18n.on('languageChanging', () => {
+    // init() changes to the initial language too; that is the first download, not a switch.
+    if (i18n.isInitialized) started = performance.now();
+  });
+  i18n.on('languageChanged', (lng: string) => {
+    pageMetricsFor(currentRoute(), lng);
+    if (started === undefined) return;
+    const from = started;
+    started = undefined;
+    void afterNextPaint().then(() => record('language-switch', performance.now() - from, currentRoute(), lng));
+  });
+}
+
+let initialized = false;
+
+/**
+ * Starts collecting LCP, INP, CLS, TTFB, route-transition and language-switch
+ * timings, tagged with the route and active language, and sends them in
+ * batches with `sendBeacon` to `VITE_METRICS_ENDPOINT` (default `/api/metrics`).
+ */
+export function initVitals(i18n: I18n) {
+  if (initialized || typeof PerformanceObserver === 'undefined') return;
+  initialized = true;
+  session = typeof crypto.randomUUID === 'function' ? crypto.randomUUID() : String(Math.random()).slice(2);
+
+  reportTtfb();
+  pageMetricsFor();
+  const reportLcp = observeLcp();
+  observeCls();
+  observeInp();
+  trackNavigationIntent();
+  trackLanguageSwitch(i18n);
+
+  addEventListener('visibilitychange', () => {
+    if (document.visibilityState !== 'hidden') return;
+    reportLcp();
+    for (const page of pageMetrics.values()) {
+      record('CLS', page.cls, page.route, page.lang);
+      if (page.interactions.length > 0) record('INP', inpOf(page.interactions), page.route, page.lang);
+    }
+    pageMetrics.clear();
+    interactionsById.clear();
+    flush();
+  });
+}
+
+/** Records how long a client-side navigation took to paint the new route, and starts its metrics. */
+export function useRouteTransitionTiming() {
+  const { pathname } = useLocation();
+  useEffect(() => {
+    pageMetricsFor();
+    if (transitionStart === undefined) return;
+    const from = transitionStart;
+    transitionStart = undefined;
+    void afterNextPaint().then(() => record('route-transition', performance.now() - from));
+  }, [pathname]);
+}
@@ -1,7 +1,19 @@
 import { defineConfig } from 'vite'
 import react from '@vitejs/plugin-react'
+import chunkManifest from './plugins/chunkManifest'
+import localeParity from './plugins/localeParity'
+import responsiveImages from './plugins/responsiveImages'
+
+// `npm run api` (server/index.mjs) serves /api locally
+const proxy = { '/api': `http://localhost:${process.env.API_PORT ?? 8787}` }
 
 // https://vite.dev/config/
 export default defineConfig({
-  plugins: [react()],
+  plugins: [react(), localeParity(), responsiveImages(), chunkManifest()],
+  server: { proxy },
+  preview: { proxy },
+  build: {
+    // dist/.vite/manifest.json maps sources to hashed chunks for scripts/prerender.mjs
+    manifest: true,
+  },
 })